@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from core.graph import Graph, CSRGraph, GraphLike, load_graph, wrap_graph
+from core.io import load_graph_json
+from sim.engine import simulate
+from sim.gen_graph import gen_native, save_native
+from strategies.base import StrategyContext
+from strategies.baselines import get_strategy
+
+FAMILIES = ("ER", "PA", "SSBM")
+# ER at average degree 1.5: thousands of small components around a
+# tree-like giant one, the worst case for spectral bisection
+FRAGMENTED = "ER_fragmented"
+
+# (get_strategy name, kwargs) for every strategy we ship
+STRATEGIES: List[Tuple[str, Dict[str, Any]]] = [
+    ("random_k", {}),
+    ("top_degree_random_tie", {"top_m": 2.0}),
+    ("top_degree_avoid", {"top_m": 3.0}),
+    ("cluster_boundary_takeover_spectral", {}),
+    ("cluster_top_degree_proportional_spectral", {}),
+    # the search strategies simulate every proposal: small budgets keep
+    # the suite short while still timing their inner loops
+    ("simulated_greedy", {"samples": 1, "lazy_batch": 4}),
+    ("local_swap", {"samples": 1, "max_evals": 10}),
+]
+
+GRAPH_SEED = 0
+MATCH_SEED = 1
+K = 10
+
+
+@dataclass
+class Case:
+    """One benchmark: `run(work_dir)` returns its metrics (seconds, ...)."""
+    name: str
+    run: Callable[[Path], Dict[str, float]] = field(repr=False)
+
+
+def _generate(family: str, n: int) -> CSRGraph:
+    """Synthetic input graph from sim.gen_graph's native generators with a
+    fixed seed (average degree ~10, or ~1.5 for FRAGMENTED)."""
+    if family == FRAGMENTED:
+        return gen_native("ER", n, GRAPH_SEED, p=1.5 / n)
+    if family == "ER":
+        return gen_native(family, n, GRAPH_SEED, p=10.0 / n)
+    if family == "PA":
+        return gen_native(family, n, GRAPH_SEED, m=5)
+    blocks = 5
+    return gen_native(family, n - n % blocks, GRAPH_SEED, k_blocks=blocks,
+                      p_in=8.0 / (n // blocks), p_out=2.0 / n)
+
+
+def graph_json(work_dir: Path, family: str, n: int) -> Path:
+    """JSON input for (family, n), generated once into work_dir."""
+    path = work_dir / f"{family}_n{n}_native.json"
+    if not path.exists():
+        work_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        save_native(_generate(family, n), tmp)
+        tmp.replace(path)
+    return path
+
+
+def bench_graph(work_dir: Path, family: str, n: int) -> CSRGraph:
+    """Input graph opened through the binary cache (not timed by the cases)."""
+    return load_graph(graph_json(work_dir, family, n))
+
+
+def _timed(fn: Callable[[], Any]) -> Tuple[float, Any]:
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def _match_seeds(G: GraphLike) -> List[List[int]]:
+    """Top-degree team vs random team, both fixed by MATCH_SEED."""
+    rng = random.Random(MATCH_SEED)
+    ctx = StrategyContext()
+    return [
+        get_strategy("top_degree_random_tie", top_m=2.0).select_seeds(G, K, rng, ctx),
+        get_strategy("random_k").select_seeds(G, K, rng, ctx),
+    ]
+
+
+def build_cases(sizes: List[int], engines: List[str]) -> List[Case]:
+    cases: List[Case] = []
+    for family in FAMILIES:
+        for n in sizes:
+            tag = f"{family}[n={n}]"
+
+            def load_nx(wd: Path, family=family, n=n) -> Dict[str, float]:
+                path = graph_json(wd, family, n)
+                sec, _ = _timed(lambda: wrap_graph(load_graph_json(path), path))
+                return {"seconds": sec}
+
+            def load_csr(wd: Path, family=family, n=n) -> Dict[str, float]:
+                path = graph_json(wd, family, n)
+                sec, _ = _timed(lambda: load_graph(path, cache=False))
+                return {"seconds": sec}
+
+            def load_cached(wd: Path, family=family, n=n) -> Dict[str, float]:
+                path = graph_json(wd, family, n)
+                load_graph(path)  # make sure the cache exists
+                sec, _ = _timed(lambda: load_graph(path))
+                return {"seconds": sec}
+
+            def from_nx(wd: Path, family=family, n=n) -> Dict[str, float]:
+                G_nx = load_graph_json(graph_json(wd, family, n))
+                sec, _ = _timed(lambda: Graph.from_networkx(G_nx))
+                return {"seconds": sec}
+
+            cases += [
+                Case(f"load_json_networkx/{tag}", load_nx),
+                Case(f"load_json_csr/{tag}", load_csr),
+                Case(f"load_cache/{tag}", load_cached),
+                Case(f"from_networkx/{tag}", from_nx),
+            ]
+
+            for engine in engines:
+                def sim(wd: Path, family=family, n=n, engine=engine) -> Dict[str, float]:
+                    # the pure-Python engines run on the list-backed Graph
+                    if engine == "numpy":
+                        G = bench_graph(wd, family, n)
+                    else:
+                        G = Graph.from_networkx(load_graph_json(graph_json(wd, family, n)))
+                    seeds = _match_seeds(G)
+                    sec, res = _timed(lambda: simulate(G, seeds, rng=random.Random(MATCH_SEED), engine=engine))
+                    return {
+                        "seconds": sec,
+                        "generations": res.num_generations,
+                        "gens_per_sec": res.num_generations / sec if sec > 0 else 0.0,
+                    }
+
+                cases.append(Case(f"simulate[{engine}]/{tag}", sim))
+
+            for name, kwargs in STRATEGIES:
+                def strat(wd: Path, family=family, n=n, name=name, kwargs=kwargs) -> Dict[str, float]:
+                    G = bench_graph(wd, family, n)
+                    s = get_strategy(name, **kwargs)
+                    sec, _ = _timed(lambda: s.select_seeds_50(G, K, random.Random(MATCH_SEED), StrategyContext()))
+                    return {"seconds": sec}
+
+                cases.append(Case(f"select_seeds_50[{name}]/{tag}", strat))
+
+    for n in sizes:
+        def fragmented(wd: Path, n=n) -> Dict[str, float]:
+            G = bench_graph(wd, FRAGMENTED, n)
+            s = get_strategy("cluster_top_degree_proportional_spectral")
+            sec, _ = _timed(lambda: s.select_seeds_50(G, K, random.Random(MATCH_SEED), StrategyContext()))
+            return {"seconds": sec}
+
+        cases.append(Case(f"select_seeds_50[cluster_top_degree_proportional_spectral]/{FRAGMENTED}[n={n}]",
+                          fragmented))
+    return cases
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Differential check of our simulators against samples/sim_TA.py.
+
+Random graphs and seed sets (seed conflicts, duplicate seeds, isolated nodes,
+self-loops, oscillating matchups that only stop at the random cap) are run
+through the TA `run_simulation` and every engine under the same cap: the TA
+code draws it from the global `random` seeded with x, our engines from
+`random.Random(x)`, which yields the same randint. Final colors and scores
+must be identical; total time per engine is reported relative to the TA code.
+
+It also checks that the sparse (LOBPCG) and dense (eigh) spectral bisections
+in strategies.cluster split a few disconnected graphs identically.
+
+    python -m benchmarks.equivalence --cases 300
+"""
+import argparse
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+import networkx as nx
+
+from core.graph import CSRGraph, Graph, GraphLike
+from samples import sim_TA
+from sim.engine import ENGINES, SimulationResult, simulate, simulate_batch
+from sim.rules import UNCOLORED
+import strategies.cluster as cluster
+
+# simulate_batch is checked alongside the single-run engines
+BATCH = "batch"
+
+
+def _random_graph(rng: random.Random, max_nodes: int) -> Tuple[str, nx.Graph]:
+    """A small random graph from one of several families, labeled 0..n-1."""
+    n = rng.randint(2, max_nodes)
+    seed = rng.randrange(2**31)
+    kind = rng.choice(("ER", "PA", "regular", "bipartite", "cycle", "tree"))
+    if kind == "ER":
+        g = nx.gnp_random_graph(n, rng.uniform(0.0, min(1.0, 8.0 / n)), seed=seed)
+    elif kind == "PA":
+        g = nx.barabasi_albert_graph(max(n, 4), rng.randint(1, 3), seed=seed)
+    elif kind == "regular":
+        d = rng.randint(1, 4)
+        g = nx.random_regular_graph(d, max(n, d + 1) + (max(n, d + 1) * d) % 2, seed=seed)
+    elif kind == "bipartite":
+        g = nx.complete_bipartite_graph(rng.randint(1, 6), rng.randint(1, 6))
+    elif kind == "cycle":
+        g = nx.cycle_graph(max(4, n + n % 2))
+    else:
+        g = nx.random_labeled_tree(n, seed=seed)
+    return kind, nx.convert_node_labels_to_integers(g)
+
+
+def _add_isolated_and_loops(rng: random.Random, g: nx.Graph, loops: bool) -> None:
+    """Isolated nodes and self-loops show up in the course graphs too."""
+    for _ in range(rng.randint(0, 3)):
+        g.add_node(g.number_of_nodes())
+    for _ in range(rng.randint(0, 2) if loops else 0):
+        u = rng.randrange(g.number_of_nodes())
+        g.add_edge(u, u)
+
+
+def _oscillating_seeds(g: nx.Graph) -> List[List[int]]:
+    """Two teams on the two sides of a bipartite graph: every node is outvoted
+    by its neighbors, so all of them flip each generation until the cap."""
+    side = nx.bipartite.color(g)
+    return [[u for u in g if side[u] == 0], [u for u in g if side[u] == 1]]
+
+
+def _random_seeds(rng: random.Random, n: int) -> List[List[int]]:
+    """Seed lists per team, with conflicts and duplicates mixed in."""
+    seeds: List[List[int]] = []
+    T = rng.randint(1, 4)
+    for _ in range(T):
+        team = rng.sample(range(n), rng.randint(0, max(1, n // 3)))
+        if team and rng.random() < 0.2:
+            team.append(rng.choice(team))  # a team naming the same node twice loses it
+        seeds.append(team)
+    if T > 1 and rng.random() < 0.5:
+        # force at least one cross-team conflict
+        shared = rng.randrange(n)
+        for team in rng.sample(seeds, 2):
+            team.append(shared)
+    return seeds
+
+
+def random_case(rng: random.Random, max_nodes: int) -> Tuple[str, nx.Graph, List[List[int]]]:
+    """(family, graph, seeds_by_team) for one differential test."""
+    kind, g = _random_graph(rng, max_nodes)
+    oscillating = kind in ("bipartite", "cycle") and rng.random() < 0.5
+    seeds = _oscillating_seeds(g) if oscillating else []
+    _add_isolated_and_loops(rng, g, loops=not oscillating)
+    if not oscillating:
+        seeds = _random_seeds(rng, g.number_of_nodes())
+    return kind, g, seeds
+
+
+def run_ta(G: GraphLike, seeds_by_team: List[List[int]], cap_seed: int) -> Tuple[List[int], List[int]]:
+    """(final colors, scores) from sim_TA.run_simulation, in our team-index encoding.
+
+    run_simulation only returns counts, so the final node colors are taken
+    from the dict it hands to get_result.
+    """
+    adj = {str(u): [str(v) for v in G.neighbors[u]] for u in range(G.n)}
+    names = [f"team{t}" for t in range(len(seeds_by_team))]
+    mappings = {name: [str(s) for s in seeds] for name, seeds in zip(names, seeds_by_team)}
+
+    captured: Dict[str, object] = {}
+    get_result = sim_TA.get_result
+
+    def capture(colors, node_color):
+        captured.update(node_color)
+        return get_result(colors, node_color)
+
+    state = random.getstate()
+    random.seed(cap_seed)
+    sim_TA.get_result = capture
+    try:
+        result = sim_TA.run_simulation(adj, mappings)
+    finally:
+        sim_TA.get_result = get_result
+        random.setstate(state)
+
+    team_of = {name: t for t, name in enumerate(names)}
+    colors = [UNCOLORED] * G.n
+    for node, color in captured.items():
+        if color is not None:
+            colors[int(node)] = team_of[color]
+    return colors, [result[name] for name in names]
+
+
+def run_engine(engine: str, G: GraphLike, seeds_by_team: List[List[int]], cap_seed: int) -> SimulationResult:
+    if engine == BATCH:
+        return simulate_batch(G, [seeds_by_team], rng=random.Random(cap_seed))[0]
+    return simulate(G, seeds_by_team, rng=random.Random(cap_seed), engine=engine)
+
+
+def _spectral_graphs() -> Dict[str, nx.Graph]:
+    """Disconnected graphs where the two eigensolvers used to disagree."""
+    mostly_isolated = nx.gnp_random_graph(60, 0.1, seed=2)
+    mostly_isolated.add_nodes_from(range(60, 300))
+    return {
+        "gnp(600, 0.002)": nx.gnp_random_graph(600, 0.002, seed=1),
+        "ER(800, 0.0015)": nx.gnp_random_graph(800, 0.0015, seed=0),
+        "ER(1000, 0.0012)": nx.gnp_random_graph(1000, 0.0012, seed=0),
+        "300 nodes, 240 isolated": mostly_isolated,
+        "200 disjoint K2": nx.disjoint_union_all([nx.complete_graph(2)] * 200),
+    }
+
+
+def check_spectral() -> List[str]:
+    """Names of the graphs where sparse and dense spectral clusters differ."""
+    if cluster.sp is None:
+        return []  # no scipy: everything runs on the dense path
+    failures = []
+    old = cluster._DENSE_MAX_NODES
+    try:
+        for name, g in _spectral_graphs().items():
+            G = CSRGraph.from_networkx(g)
+            cluster._DENSE_MAX_NODES = G.n
+            dense = cluster._compute_spectral_clusters(G)
+            cluster._DENSE_MAX_NODES = 0
+            sparse = cluster._compute_spectral_clusters(G)
+            if dense != sparse:
+                failures.append(f"spectral clusters on {name}: sparse and dense paths differ")
+    finally:
+        cluster._DENSE_MAX_NODES = old
+    return failures
+
+
+def _timed(fn: Callable[[], object]) -> Tuple[float, object]:
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check every simulation engine against samples/sim_TA.py.")
+    parser.add_argument("--cases", default=200, type=int, help="Number of random cases (default: 200).")
+    parser.add_argument("--max-nodes", default=200, type=int, help="Largest random graph (default: 200).")
+    parser.add_argument("--seed", default=0, type=int, help="Seed for the case generator (default: 0).")
+    parser.add_argument("--engines", default=",".join(ENGINES + (BATCH,)), type=str,
+                        help=f"Comma-separated engines from {ENGINES + (BATCH,)} (default: all).")
+    args = parser.parse_args()
+
+    engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+    for e in engines:
+        if e not in ENGINES + (BATCH,):
+            raise ValueError(f"Unknown engine: {e}")
+
+    rng = random.Random(args.seed)
+    ta_seconds = 0.0
+    seconds: Dict[str, float] = {e: 0.0 for e in engines}
+    failures: List[str] = []
+    capped = 0
+
+    for case in range(args.cases):
+        kind, g, seeds = random_case(rng, args.max_nodes)
+        cap_seed = rng.randrange(2**31)
+        G_list = Graph.from_networkx(g)
+        G_csr = CSRGraph.from_graph(G_list)
+
+        sec, (ta_colors, ta_scores) = _timed(lambda: run_ta(G_list, seeds, cap_seed))
+        ta_seconds += sec
+
+        for engine in engines:
+            # the pure-Python engines are compared on the list-backed Graph
+            G = G_list if engine in ("reference", "frontier") else G_csr
+            sec, res = _timed(lambda: run_engine(engine, G, seeds, cap_seed))
+            seconds[engine] += sec
+            if res.final_colors != ta_colors or res.scores != ta_scores:
+                failures.append(
+                    f"case {case} ({kind}, n={G.n}, seeds per team={[len(x) for x in seeds]}) engine={engine}: "
+                    f"scores {res.scores} vs TA {ta_scores}"
+                )
+            if engine == engines[0] and res.num_generations >= 100:
+                capped += 1
+
+    spectral = check_spectral()
+    failures.extend(spectral)
+
+    print(f"{args.cases} cases ({capped} ran into the random cap)")
+    print(f"{'TA sim_TA.run_simulation':<28} {ta_seconds:>9.3f}s")
+    for engine in engines:
+        speedup = ta_seconds / seconds[engine] if seconds[engine] > 0 else float("inf")
+        print(f"{engine:<28} {seconds[engine]:>9.3f}s  {speedup:>7.1f}x")
+
+    if not spectral:
+        print("Sparse and dense spectral bisection agree on disconnected graphs.")
+
+    if failures:
+        print(f"\n=== {len(failures)} mismatch(es) ===")
+        for line in failures:
+            print(line)
+        sys.exit(1)
+    print("\nAll engines match the TA simulator.")
+
+
+if __name__ == "__main__":
+    main()
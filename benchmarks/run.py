@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import platform
+import resource
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from benchmarks.cases import build_cases
+from sim.engine import ENGINES
+
+
+def _run_case(name: str, sizes: List[int], engines: List[str], work_dir: str, repeat: int) -> Dict[str, float]:
+    """Runs in a fresh process, so peak RSS belongs to this case alone."""
+    case = next(c for c in build_cases(sizes, engines) if c.name == name)
+    runs = [case.run(Path(work_dir)) for _ in range(repeat)]
+    best = min(runs, key=lambda m: m["seconds"])
+    best = dict(best)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    best["peak_rss_mb"] = rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    return best
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+    min_seconds: float = 0.005,
+) -> List[str]:
+    """Cases whose time grew by more than `threshold` (relative) vs the baseline.
+
+    Cases faster than min_seconds in both runs are ignored as noise.
+    """
+    regressions = []
+    for name, m in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        t_old, t_new = old["seconds"], m["seconds"]
+        if max(t_old, t_new) < min_seconds:
+            continue
+        if t_new > t_old * (1.0 + threshold):
+            regressions.append(f"{name}: {t_old:.4f}s -> {t_new:.4f}s (+{100 * (t_new / t_old - 1):.0f}%)")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark graph loading, simulation and strategies.")
+    parser.add_argument("--sizes", default="1000,10000", type=str,
+                        help="Comma-separated node counts (default: 1000,10000; e.g. up to 200000).")
+    parser.add_argument("--engines", default="numpy,frontier", type=str,
+                        help=f"Comma-separated engines from {ENGINES} (default: numpy,frontier).")
+    parser.add_argument("--filter", default=None, type=str, help="Only run cases whose name contains this.")
+    parser.add_argument("--repeat", default=3, type=int, help="Runs per case; the fastest is kept (default: 3).")
+    parser.add_argument("--work-dir", default=".bench_cache", type=str, help="Where generated inputs are kept.")
+    parser.add_argument("--save", default=None, type=str, help="Write results as a JSON baseline.")
+    parser.add_argument("--compare", default=None, type=str, help="Baseline JSON to check for regressions.")
+    parser.add_argument("--threshold", default=0.2, type=float, help="Relative slowdown flagged as regression (default: 0.2).")
+    args = parser.parse_args()
+
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+    for e in engines:
+        if e not in ENGINES:
+            raise ValueError(f"Unknown engine: {e}")
+
+    cases = build_cases(sizes, engines)
+    if args.filter:
+        cases = [c for c in cases if args.filter in c.name]
+
+    results: Dict[str, Dict[str, float]] = {}
+    # one process per case (max_tasks_per_child=1) for clean peak-RSS numbers
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn"), max_tasks_per_child=1) as pool:
+        for case in cases:
+            m = pool.submit(_run_case, case.name, sizes, engines, args.work_dir, args.repeat).result()
+            results[case.name] = m
+            extra = f"  {m['gens_per_sec']:.1f} gen/s" if "gens_per_sec" in m else ""
+            print(f"{case.name:<70} {m['seconds']:>9.4f}s  {m['peak_rss_mb']:>8.1f} MB{extra}", flush=True)
+
+    report: Dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "sizes": sizes,
+            "engines": engines,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+        print(f"Wrote baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n=== {len(regressions)} regression(s) vs {args.compare} ===")
+            for line in regressions:
+                print(line)
+            sys.exit(1)
+        print(f"\nNo regressions vs {args.compare} (threshold {args.threshold:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
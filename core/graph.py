@@ -1,14 +1,86 @@
 from __future__ import annotations
 
 import networkx as nx
+import numpy as np
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Optional, Union, Dict, Any
+from functools import cached_property
+from typing import Iterable, List, Sequence, Optional, Union, Dict, Any, Tuple
 from pathlib import Path
 
-from core.io import infer_from_filename
+from core.io import (
+    EDGE_LIST_SUFFIXES,
+    GRAPH_CALTECH,
+    GRAPH_SNAP,
+    infer_from_filename,
+    read_edge_list,
+    read_graph_json_edges,
+    GRAPH_CACHE_SUFFIX,
+    graph_cache_dir,
+    read_graph_cache,
+    write_graph_cache,
+)
+
+
+def _seed_array(seeds: Any) -> np.ndarray:
+    """Flat int64 array of every seed in a (possibly ragged) nesting of lists."""
+    try:
+        return np.asarray(seeds, dtype=np.int64).ravel()
+    except (TypeError, ValueError):
+        if isinstance(seeds, (str, bytes)) or not isinstance(seeds, Iterable):
+            raise ValueError(f"Invalid seed: {seeds!r}") from None
+        # ragged: flatten one level at a time
+        parts = [_seed_array(x) for x in seeds]
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+
+class _GraphBase:
+    """Behaviour shared by the list-backed and CSR-backed graphs."""
+
+    n: int
+
+    @cached_property
+    def memo(self) -> Dict[Any, Any]:
+        """Per-graph cache for derived data (e.g. spectral clusterings)."""
+        return {}
+
+    @cached_property
+    def degree_order(self) -> np.ndarray:
+        """Nodes by degree descending, ties by node id (int32), computed once.
+
+        Same order as sorted(range(n), key=degree, reverse=True).
+        """
+        deg = np.asarray(self.degrees, dtype=np.int64)
+        return np.argsort(-deg, kind="stable").astype(np.int32)
+
+    @cached_property
+    def degree_block_starts(self) -> np.ndarray:
+        """Positions in degree_order where a new degree begins, followed by n.
+
+        Block b (all nodes of one degree) is
+        degree_order[starts[b]:starts[b + 1]].
+        """
+        deg = np.asarray(self.degrees, dtype=np.int64)[self.degree_order]
+        change = np.flatnonzero(deg[1:] != deg[:-1]) + 1
+        return np.concatenate(([0] if self.n else [], change, [self.n])).astype(np.int64)
+
+    def top_degree(self, m: int) -> List[int]:
+        """The m highest-degree nodes (ties by node id)."""
+        return self.degree_order[:max(0, m)].tolist()
+
+    def validate_seeds(self, seeds: Any) -> None:
+        """Raise ValueError on the first seed outside 0..n-1.
+
+        seeds is one seed list or any nesting of them (rounds x teams x k,
+        ragged or an int array); all of them are checked in one pass.
+        """
+        arr = _seed_array(seeds)
+        bad = (arr < 0) | (arr >= self.n)
+        if bad.any():
+            raise ValueError(f"Seed out of range: {arr[bad][0]} (n={self.n})")
+
 
 @dataclass(frozen=True)
-class Graph:
+class Graph(_GraphBase):
     """Light wrapper over an undirected graph with cached adjacency and degrees.
 
     We assume nodes are labeled 0..n-1 (ints).
@@ -37,22 +109,202 @@ class Graph:
             family=family,
         )
 
-    def validate_seeds(self, seeds: Sequence[int]) -> None:
-        for s in seeds:
-            if not (0 <= int(s) < self.n):
-                raise ValueError(f"Seed out of range: {s} (n={self.n})")
+    @cached_property
+    def csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """CSR adjacency (indptr, indices) as int32 arrays, built once per graph.
+
+        Row u of the adjacency is indices[indptr[u]:indptr[u+1]].
+        """
+        indptr = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(self.degrees, out=indptr[1:])
+        indices = np.fromiter(
+            (v for nbrs in self.neighbors for v in nbrs),
+            dtype=np.int32,
+            count=int(indptr[-1]),
+        )
+        return indptr.astype(np.int32), indices
+
+
+class CSRNeighbors(Sequence):
+    """Read-only `neighbors[u]` view over CSR arrays; rows are int32 slices."""
+
+    __slots__ = ("_indptr", "_indices")
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray):
+        self._indptr = indptr
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return self._indptr.shape[0] - 1
+
+    def __getitem__(self, u):
+        if isinstance(u, slice):
+            return [self[i] for i in range(*u.indices(len(self)))]
+        if u < 0:
+            u += len(self)
+        return self._indices[self._indptr[u]:self._indptr[u + 1]]
+
+
+@dataclass(frozen=True, eq=False)
+class CSRGraph(_GraphBase):
+    """Array-backed Graph with the same public surface as `Graph`.
+
+    Adjacency is stored once as CSR (int32 indptr/indices, both edge
+    directions), so a 100k-node graph costs a few MB instead of hundreds.
+    `neighbors[u]` is a zero-copy slice of `indices`. Compared by identity.
+    """
+    n: int
+    indptr: np.ndarray              # int32, length n+1
+    indices: np.ndarray             # int32, length indptr[-1]
+    degrees: np.ndarray             # int32, length n
+
+    comp: Optional[str] = None      # 'RR' or 'J'
+    k: Optional[int] = None         # seeds per round
+    family: Optional[str] = None    # 'ER', 'PA', 'SSBM', 'Caltech', 'SNAP'
+
+    @property
+    def neighbors(self) -> CSRNeighbors:
+        return CSRNeighbors(self.indptr, self.indices)
+
+    @property
+    def csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.indptr, self.indices
+
+    @staticmethod
+    def from_csr(indptr: np.ndarray, indices: np.ndarray, *, comp: Optional[str] = None,
+                 k: Optional[int] = None, family: Optional[str] = None) -> "CSRGraph":
+        indptr = np.asarray(indptr, dtype=np.int32)
+        indices = np.asarray(indices, dtype=np.int32)
+        return CSRGraph(
+            n=indptr.shape[0] - 1,
+            indptr=indptr,
+            indices=indices,
+            degrees=np.diff(indptr).astype(np.int32, copy=False),
+            comp=comp,
+            k=k,
+            family=family,
+        )
+
+    @staticmethod
+    def from_edges(n: int, src: np.ndarray, dst: np.ndarray, *, comp: Optional[str] = None,
+                   k: Optional[int] = None, family: Optional[str] = None) -> "CSRGraph":
+        """Build from an edge list: edges are symmetrized and deduplicated,
+        self-loops kept once (as in networkx), rows sorted by neighbor id."""
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        base = max(n, 1)
+        keys = np.concatenate([src * base + dst, dst * base + src])
+        keys.sort()
+        if keys.size:
+            keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        rows = keys // base
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        return CSRGraph.from_csr(indptr, keys % base, comp=comp, k=k, family=family)
+
+    @staticmethod
+    def from_graph(G: Graph) -> "CSRGraph":
+        indptr, indices = G.csr
+        return CSRGraph.from_csr(indptr, indices, comp=G.comp, k=G.k, family=G.family)
+
+    @staticmethod
+    def from_networkx(G: nx.Graph, *, comp: Optional[str] = None, k: Optional[int] = None,
+                      family: Optional[str] = None) -> "CSRGraph":
+        n = G.number_of_nodes()
+        # assumes nodes 0..n-1
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(G.adj[u]) for u in range(n)], out=indptr[1:])
+        indices = np.fromiter(
+            (v for u in range(n) for v in G.adj[u]),
+            dtype=np.int32,
+            count=int(indptr[-1]),
+        )
+        return CSRGraph.from_csr(indptr, indices, comp=comp, k=k, family=family)
+
+
+GraphLike = Union[Graph, CSRGraph]
+
+def _resolve_meta(
+        source_path: Union[str, Path],
+        meta_override: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+    comp, k, family = infer_from_filename(source_path)
+    if meta_override is not None:
+        comp = meta_override.get("comp", comp)
+        k = meta_override.get("k", k)
+        family = meta_override.get("family", family)
+    return comp, k, family
+
+def load_graph(
+        path: Union[str, Path],
+        meta_override: Optional[Dict[str, Any]] = None,
+        cache: bool = True,
+    ) -> CSRGraph:
+    """
+    Load a JSON adjacency graph straight into a CSRGraph, inferring metadata
+    from the path. Never builds a networkx object.
+
+    Edge lists and Matrix Market files (core.io.EDGE_LIST_SUFFIXES) are read
+    with core.io.read_edge_list; their nodes are relabeled to 0..n-1 in
+    sorted id order. Unless the filename says otherwise, their family is
+    'Caltech' for .mtx and 'SNAP' for plain edge lists.
+
+    With cache=True the CSR arrays are written to a binary cache next to the
+    JSON on first load (see core.io.graph_cache_dir) and memory-mapped from it
+    afterwards, so warm loads are near-instant and processes share pages.
+
+    `path` may also be a cache directory on its own (e.g. written by
+    `sim.gen_graph --format csr`), with no JSON next to it.
+    """
+    if Path(path).suffix == GRAPH_CACHE_SUFFIX and Path(path).is_dir():
+        cached = read_graph_cache(path)
+        if cached is None:
+            raise ValueError(f"{path}: not a readable graph cache")
+        indptr, indices, meta = cached
+        override = {key: meta[key] for key in ("comp", "k", "family") if key in meta}
+        if meta_override is not None:
+            override.update(meta_override)
+        return CSRGraph.from_csr(indptr, indices, comp=override.get("comp"), k=override.get("k"),
+                                 family=override.get("family"))
+
+    cache_dir = graph_cache_dir(path)
+    cached = read_graph_cache(cache_dir, source_path=path) if cache else None
+    if cached is not None:
+        indptr, indices, meta = cached
+        override = {key: meta[key] for key in ("comp", "k", "family") if key in meta}
+        if meta_override is not None:
+            override.update(meta_override)
+        comp, k, family = _resolve_meta(path, override)
+        return CSRGraph.from_csr(indptr, indices, comp=comp, k=k, family=family)
+
+    c0, k0, f0 = infer_from_filename(path)
+    suffix = Path(path).suffix.lower()
+    if suffix in EDGE_LIST_SUFFIXES:
+        n, src, dst, _ = read_edge_list(path)
+        if f0 is None:
+            f0 = GRAPH_CALTECH if suffix == ".mtx" else GRAPH_SNAP
+    else:
+        n, src, dst = read_graph_json_edges(path)
+    comp, k, family = _resolve_meta(path, dict({"family": f0}, **(meta_override or {})))
+    G = CSRGraph.from_edges(n, src, dst, comp=comp, k=k, family=family)
+    if cache:
+        try:
+            write_graph_cache(cache_dir, G.indptr, G.indices,
+                              {"comp": c0, "k": k0, "family": f0}, source_path=path)
+        except OSError:
+            pass  # read-only location: just skip caching
+    return G
 
 def wrap_graph(
         G_nx:nx.Graph, 
         sourse_path: Union[str, Path],
-        meta_override: Optional[Dict[str, Any]] = None
-    ) -> Graph:
+        meta_override: Optional[Dict[str, Any]] = None,
+        csr: bool = False,
+    ) -> GraphLike:
     """
     Convert a networkx graph to our Graph format, inferring metadata from the source path.
+    With csr=True the compact CSRGraph is returned instead.
     """
-    comp, k, family = infer_from_filename(sourse_path)
-    if meta_override is not None:
-        comp = meta_override.get("comp", comp)
-        k = meta_override.get("k", k)
-        family = meta_override.get("family", family)
-    return Graph.from_networkx(G_nx, comp=comp, k=k, family=family)
\ No newline at end of file
+    comp, k, family = _resolve_meta(sourse_path, meta_override)
+    cls = CSRGraph if csr else Graph
+    return cls.from_networkx(G_nx, comp=comp, k=k, family=family)
\ No newline at end of file
@@ -1,9 +1,14 @@
 # python/core/io.py
 
+import hashlib
 import json
+import os
+import re
+import shutil
 import networkx as nx
+import numpy as np
 from pathlib import Path
-from typing import List, Union, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Union, Optional, Tuple
 from pathlib import Path
 
 # Graph family labels
@@ -49,26 +54,396 @@ def load_graph_json(path: Union[str, Path]) -> nx.Graph:
 
     return G
 
-def save_graph_json(G: nx.Graph, out_path: Union[str, Path]) -> None:
+# one `"node": [ ... ]` entry of the adjacency JSON (neighbors quoted or not)
+_ADJ_ENTRY_RE = re.compile(r'"\s*(-?\d+)\s*"\s*:\s*\[([^\]]*)\]')
+
+def read_graph_json_edges(
+    path: Union[str, Path],
+    chunk_size: int = 1 << 22,
+) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Stream-parse the project JSON format into raw edge arrays.
+
+    The file is scanned in chunks of `chunk_size` characters; each chunk's
+    complete `"u": [...]` entries are converted to int32 (src, dst) arrays in
+    one vectorized pass, so no dict of strings is ever built and peak memory
+    stays close to the size of the edge arrays.
+
+    Returns:
+        (n, src, dst) where n = max node id + 1. Edges are as listed in the
+        file (not yet symmetrized or deduplicated). Nodes that only appear as
+        keys (isolated nodes) are still counted in n.
+    """
+    src_parts: List[np.ndarray] = []
+    dst_parts: List[np.ndarray] = []
+    max_id = -1
+    tail = ""
+
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            buf = tail + chunk
+            keys: List[int] = []
+            bodies: List[str] = []
+            counts: List[int] = []
+            end = 0
+            for m in _ADJ_ENTRY_RE.finditer(buf):
+                body = m.group(2).replace('"', "")
+                keys.append(int(m.group(1)))
+                if body.strip():
+                    bodies.append(body)
+                    counts.append(body.count(",") + 1)
+                else:
+                    counts.append(0)
+                end = m.end()
+            tail = buf[end:]
+
+            if keys:
+                key_arr = np.asarray(keys, dtype=np.int64)
+                dst = np.fromstring(",".join(bodies), dtype=np.int64, sep=",")
+                if dst.shape[0] != sum(counts):
+                    raise ValueError(f"{path}: malformed neighbor list")
+                src = np.repeat(key_arr, counts)
+                lo = min(int(key_arr.min()), int(dst.min()) if dst.size else 0)
+                if lo < 0:
+                    raise ValueError(f"{path}: negative node id {lo}")
+                max_id = max(max_id, int(key_arr.max()), int(dst.max()) if dst.size else -1)
+                src_parts.append(src.astype(np.int32))
+                dst_parts.append(dst.astype(np.int32))
+
+            if not chunk:
+                break
+
+    if tail.strip(" \t\r\n{},"):
+        raise ValueError(f"{path}: could not parse trailing content {tail[:50]!r}")
+
+    if not src_parts:
+        empty = np.zeros(0, dtype=np.int32)
+        return 0, empty, empty
+    return max_id + 1, np.concatenate(src_parts), np.concatenate(dst_parts)
+
+# whitespace edge lists (SNAP style) and Matrix Market coordinate files
+EDGE_LIST_SUFFIXES = (".txt", ".edges", ".edgelist", ".tsv", ".el", ".mtx")
+
+# a comment runs from '#' or '%' to the end of its line (whole or trailing)
+_COMMENT_RE = re.compile(r"[#%][^\n]*")
+
+def _edge_list_blocks(path: Union[str, Path], chunk_size: int) -> Iterator[str]:
+    """Comment-free text blocks of whole lines; every line of the file is in
+    exactly one block, so line numbers can be recovered by counting."""
+    tail = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            buf = tail + chunk
+            cut = buf.rfind(b"\n") + 1 if chunk else len(buf)
+            block, tail = buf[:cut].decode("ascii"), buf[cut:]
+            if "#" in block or "%" in block:
+                block = _COMMENT_RE.sub("", block)
+            yield block
+            if not chunk:
+                break
+
+def _edge_list_error(path: Union[str, Path], block: str, first_line: int, ncols: int) -> str:
+    """Message naming the first line of `block` that is not `ncols` numbers."""
+    for i, line in enumerate(block.split("\n")):
+        tokens = line.split()
+        if not tokens:
+            continue
+        parse = int if ncols == 2 else float  # as np.fromstring's dtype below
+        ok = len(tokens) == ncols
+        try:
+            for t in tokens:
+                parse(t)
+        except ValueError:
+            ok = False
+        if not ok:
+            return f"{path}: line {first_line + i}: expected {ncols} numbers, got {line.strip()!r}"
+    return f"{path}: rows with a varying number of columns"
+
+def read_edge_list(
+    path: Union[str, Path],
+    chunk_size: int = 1 << 24,
+) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse a whitespace edge list or a Matrix Market coordinate file into raw
+    edge arrays.
+
+    '#' and '%' start a comment, on a line of its own or after the ids. Only the first two columns
+    are used (weights, timestamps, ... are ignored). The file is read in
+    chunks of `chunk_size` bytes and every chunk's numbers are parsed in one
+    np.fromstring call.
+
+    Edge lists: node ids are arbitrary non-negative integers, relabeled to
+    0..n-1 in sorted order (np.unique(return_inverse), or a presence table
+    when the ids are compact); labels[i] is the original id of node i. Nodes without edges cannot appear.
+    .mtx: the size line gives n (isolated nodes included) and ids are
+    1-based, so node i is labels[i] = i + 1.
+
+    Returns:
+        (n, src, dst, labels); edges are as listed, not yet symmetrized or
+        deduplicated.
+    """
+    mtx = Path(path).suffix.lower() == ".mtx"
+    ids: List[np.ndarray] = []
+    ncols = 0
+    n_mtx = -1
+
+    line_no = 1
+    for block in _edge_list_blocks(path, chunk_size):
+        first_line = line_no
+        line_no += block.count("\n")
+        if not block.strip():
+            continue
+        if mtx and n_mtx < 0:
+            lines = block.split("\n")
+            i = next(i for i, line in enumerate(lines) if line.strip())
+            rows, cols, *_ = (int(x) for x in lines[i].split())
+            n_mtx = max(rows, cols)
+            lines[i] = ""  # keep the line count
+            block = "\n".join(lines)
+            if not block.strip():
+                continue
+        if not ncols:
+            first = next(line for line in block.split("\n") if line.strip())
+            ncols = len(first.split())
+            if ncols < 2:
+                raise ValueError(f"{path}: expected at least two columns, got {first.strip()!r}")
+        try:
+            nums = np.fromstring(block.strip(), dtype=np.int64 if ncols == 2 else np.float64, sep=" ")
+        except ValueError:
+            nums = None
+        if nums is None or nums.shape[0] % ncols:
+            raise ValueError(_edge_list_error(path, block, first_line, ncols))
+        ids.append(nums.reshape(-1, ncols)[:, :2].astype(np.int64))
+
+    pairs = np.concatenate(ids) if ids else np.zeros((0, 2), dtype=np.int64)
+    if pairs.size and int(pairs.min()) < (1 if mtx else 0):
+        raise ValueError(f"{path}: node id {int(pairs.min())} out of range")
+
+    if mtx:
+        n = max(n_mtx, int(pairs.max()) if pairs.size else 0)
+        labels = np.arange(1, n + 1, dtype=np.int64)
+        pairs = pairs - 1
+    elif pairs.size and int(pairs.max()) < 4 * pairs.size:
+        # compact ids (the usual SNAP case): a presence table avoids the sort
+        present = np.zeros(int(pairs.max()) + 1, dtype=bool)
+        present[pairs.ravel()] = True
+        labels = np.flatnonzero(present)
+        n = labels.shape[0]
+        pairs = (np.cumsum(present) - 1)[pairs]
+    else:
+        labels, inverse = np.unique(pairs, return_inverse=True)
+        n = labels.shape[0]
+        pairs = inverse.reshape(-1, 2)
+    return n, pairs[:, 0].astype(np.int32), pairs[:, 1].astype(np.int32), labels
+
+# Binary graph cache: <graph>.json -> <graph>.json.csr/{indptr.npy, indices.npy, meta.json}
+GRAPH_CACHE_SUFFIX = ".csr"
+GRAPH_CACHE_VERSION = 1
+
+def graph_cache_dir(path: Union[str, Path]) -> Path:
+    """Cache directory written next to a graph file.
+
+    Keyed on the full file name, so foo.json and foo.txt get separate caches.
+    """
+    path = Path(path)
+    return path.with_name(path.name + GRAPH_CACHE_SUFFIX)
+
+def _file_sha1(path: Union[str, Path]) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def _source_stamp(path: Union[str, Path], with_hash: bool = True) -> Dict[str, Any]:
+    st = os.stat(path)
+    stamp: Dict[str, Any] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if with_hash:
+        stamp["sha1"] = _file_sha1(path)
+    return stamp
+
+def write_graph_cache(
+    cache_dir: Union[str, Path],
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    meta: Dict[str, Any],
+    source_path: Optional[Union[str, Path]] = None,
+) -> None:
+    """
+    Write CSR arrays as raw .npy files plus a meta.json header.
+
+    The directory is staged under a temporary name and renamed into place, so
+    concurrent readers only ever see a complete cache. If another process
+    wins the race, its cache is kept.
+    """
+    cache_dir = Path(cache_dir)
+    tmp_dir = cache_dir.with_name(f"{cache_dir.name}.tmp{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    try:
+        np.save(tmp_dir / "indptr.npy", np.asarray(indptr, dtype=np.int32))
+        np.save(tmp_dir / "indices.npy", np.asarray(indices, dtype=np.int32))
+        header = dict(meta)
+        header["version"] = GRAPH_CACHE_VERSION
+        header["n"] = int(len(indptr) - 1)
+        if source_path is not None:
+            header["source"] = _source_stamp(source_path)
+        with (tmp_dir / "meta.json").open("w", encoding="utf-8") as f:
+            json.dump(header, f)
+
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        try:
+            os.replace(tmp_dir, cache_dir)
+        except OSError:
+            pass  # concurrent writer got there first
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def read_graph_cache(
+    cache_dir: Union[str, Path],
+    source_path: Optional[Union[str, Path]] = None,
+    mmap: bool = True,
+) -> Optional[Tuple[np.ndarray, np.ndarray, Dict[str, Any]]]:
+    """
+    Open a graph cache written by write_graph_cache.
+
+    Returns (indptr, indices, meta), with the arrays memory-mapped read-only
+    when mmap=True, or None if the cache is missing, from another format
+    version, or stale with respect to source_path. Staleness is decided by
+    size + mtime; if only the mtime moved, the stored content hash decides.
+    """
+    cache_dir = Path(cache_dir)
+    try:
+        with (cache_dir / "meta.json").open("r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != GRAPH_CACHE_VERSION:
+        return None
+
+    if source_path is not None:
+        stored = meta.get("source")
+        if stored is None:
+            return None
+        try:
+            current = _source_stamp(source_path, with_hash=False)
+        except OSError:
+            return None
+        if current["size"] != stored.get("size"):
+            return None
+        if current["mtime_ns"] != stored.get("mtime_ns"):
+            if _file_sha1(source_path) != stored.get("sha1"):
+                return None
+            # same content, new mtime: refresh the stamp so we hash only once
+            stored["mtime_ns"] = current["mtime_ns"]
+            tmp_meta = cache_dir / f"meta.json.tmp{os.getpid()}"
+            try:
+                with tmp_meta.open("w", encoding="utf-8") as f:
+                    json.dump(meta, f)
+                os.replace(tmp_meta, cache_dir / "meta.json")
+            except OSError:
+                pass
+
+    mode = "r" if mmap else None
+    try:
+        indptr = np.load(cache_dir / "indptr.npy", mmap_mode=mode)
+        indices = np.load(cache_dir / "indices.npy", mmap_mode=mode)
+    except (OSError, ValueError):
+        return None
+    if indptr.shape[0] != meta.get("n", -1) + 1 or indices.shape[0] != int(indptr[-1]):
+        return None
+    return indptr, indices, meta
+
+# nodes formatted per buffered write in the streaming JSON writer
+_JSON_CHUNK_NODES = 1 << 14
+
+def _write_adjacency_json(f, rows: Iterable[Sequence[int]]) -> None:
+    """
+    Write `{"0": [..], "1": [..], ...}` for rows of nodes 0, 1, ..., byte for
+    byte what json.dump writes for the equivalent dict (", " and ": "
+    separators), one buffered write per _JSON_CHUNK_NODES nodes.
+    """
+    f.write("{")
+    parts: List[str] = []
+    sep = ""
+    for u, row in enumerate(rows):
+        parts.append(f'"{u}": [{", ".join(map(str, row))}]')
+        if len(parts) == _JSON_CHUNK_NODES:
+            f.write(sep + ", ".join(parts))
+            parts, sep = [], ", "
+    if parts:
+        f.write(sep + ", ".join(parts))
+    f.write("}")
+
+def _csr_rows(indptr: np.ndarray, indices: np.ndarray) -> Iterator[List[int]]:
+    """Rows of a CSR adjacency as int lists, converted a chunk at a time."""
+    n = len(indptr) - 1
+    for a in range(0, n, _JSON_CHUNK_NODES):
+        b = min(n, a + _JSON_CHUNK_NODES)
+        lo = int(indptr[a])
+        flat = indices[lo:int(indptr[b])].tolist()
+        cuts = (np.asarray(indptr[a:b + 1], dtype=np.int64) - lo).tolist()
+        for i in range(b - a):
+            yield flat[cuts[i]:cuts[i + 1]]
+
+def _networkx_rows(G: nx.Graph) -> Iterator[List[int]]:
+    """
+    Rows of a networkx graph relabeled to 0..n-1 by sorted node, in the
+    neighbor order nx.relabel_nodes(copy=True) would produce: the copy adds
+    G.edges() in order, so a node first lists the neighbors that precede it
+    in G's node order (in that order), then the rest in its own adjacency
+    order.
     """
-    Save a networkx undirected graph to the project JSON adjacency list format.
-    Ensures nodes are 0..n-1 by relabeling if needed.
+    label = {old: i for i, old in enumerate(sorted(G.nodes()))}
+    pos = {u: i for i, u in enumerate(G)}
+    adj = G.adj
+    for u in sorted(G.nodes()):
+        pu = pos[u]
+        earlier = sorted((pos[v], v) for v in adj[u] if pos[v] < pu)
+        row = [label[v] for _, v in earlier]
+        row += [label[v] for v in adj[u] if pos[v] >= pu]
+        yield row
+
+def save_graph_json(G: Any, out_path: Union[str, Path]) -> None:
+    """
+    Save a graph to the project JSON adjacency list format, streamed node by
+    node (no relabeled copy, no intermediate dict).
+
+    G may be:
+      - a networkx undirected graph: nodes are relabeled to 0..n-1 in sorted
+        order, and the output is byte-identical to json.dump of the relabeled
+        adjacency dict
+      - a Graph / CSRGraph (nodes already 0..n-1)
+      - an (n, src, dst) tuple of edge arrays: symmetrized and deduplicated
+        as in CSRGraph.from_edges
     """
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Relabel to 0..n-1 (deterministic)
-    nodes = sorted(G.nodes())
-    mapping = {old: i for i, old in enumerate(nodes)}
-    G2 = nx.relabel_nodes(G, mapping, copy=True)
+    if isinstance(G, tuple):
+        from core.graph import CSRGraph  # core.graph imports this module
+        G = CSRGraph.from_edges(*G)
+    if isinstance(G, nx.Graph):
+        rows: Iterable[Sequence[int]] = _networkx_rows(G)
+    elif isinstance(G.neighbors, list):
+        rows = G.neighbors
+    else:
+        rows = _csr_rows(*G.csr)
 
-    adj = {str(u): [int(v) for v in G2.neighbors(u)] for u in sorted(G2.nodes())}
+    with out_path.open("w", encoding="utf-8") as f:
+        _write_adjacency_json(f, rows)
 
+def save_csr_json(indptr: np.ndarray, indices: np.ndarray, out_path: Union[str, Path]) -> None:
+    """Save CSR adjacency (nodes 0..n-1) in the project JSON format."""
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
     with out_path.open("w", encoding="utf-8") as f:
-        json.dump(adj, f)
+        _write_adjacency_json(f, _csr_rows(indptr, indices))
 
 def write_submission_txt(
-    seeds_by_round: List[List[int]],
+    seeds_by_round: Union[List[List[int]], np.ndarray],
     out_path: Union[str, Path]
 ) -> None:
     """Write seeds in the required submission format.
@@ -77,12 +452,101 @@ def write_submission_txt(
     The file concatenates rounds in order: round1 k lines, round2 k lines, ...
 
     Example: for k=4, rounds=50 => total 200 lines.
+    The whole file is formatted first and written at once.
     """
     out_path = Path(out_path)
+    ids = [int(s) for round_seeds in seeds_by_round for s in round_seeds]
     with out_path.open("w", encoding="utf-8") as f:
-        for round_seeds in seeds_by_round:
-            for s in round_seeds:
-                f.write(f"{int(s)}\n")
+        f.write("".join(f"{s}\n" for s in ids))
+
+# Submission sidecar: <sub>.txt -> <sub>.seeds (magic, int64 size, int64
+# mtime_ns of the text file, int32 rounds, int32 k, int32[rounds * k] ids)
+SUBMISSION_SIDECAR_SUFFIX = ".seeds"
+_SIDECAR_MAGIC = b"SEEDS001"
+_SIDECAR_HEADER = len(_SIDECAR_MAGIC) + 8 + 8 + 4 + 4
+
+def _one_token_per_line(data: bytes) -> bool:
+    """No line of `data` holds two whitespace-separated tokens."""
+    b = np.frombuffer(data, dtype=np.uint8)
+    newline = b == 10
+    solid = np.flatnonzero(~(newline | (b == 32) | (b == 9) | (b == 13)))
+    # a gap between two consecutive non-blank bytes must contain a newline
+    gap = np.flatnonzero(solid[1:] - solid[:-1] > 1)
+    lines = np.cumsum(newline)
+    return bool(np.all(lines[solid[gap + 1]] != lines[solid[gap]]))
+
+def _read_sidecar(path: Path, stamp: Dict[str, Any], k: int, rounds: int) -> Optional[np.ndarray]:
+    try:
+        with path.open("rb") as f:
+            head = f.read(_SIDECAR_HEADER)
+            if len(head) != _SIDECAR_HEADER or head[:len(_SIDECAR_MAGIC)] != _SIDECAR_MAGIC:
+                return None
+            size, mtime_ns = np.frombuffer(head, dtype=np.int64, count=2, offset=len(_SIDECAR_MAGIC))
+            r, kk = np.frombuffer(head, dtype=np.int32, count=2, offset=len(_SIDECAR_MAGIC) + 16)
+            if (size, mtime_ns) != (stamp["size"], stamp["mtime_ns"]) or (r, kk) != (rounds, k):
+                return None
+            seeds = np.frombuffer(f.read(), dtype=np.int32)
+    except OSError:
+        return None
+    if seeds.shape[0] != rounds * k:
+        return None
+    return seeds.reshape(rounds, k)
+
+def _write_sidecar(path: Path, stamp: Dict[str, Any], seeds: np.ndarray) -> None:
+    tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    try:
+        with tmp.open("wb") as f:
+            f.write(_SIDECAR_MAGIC)
+            f.write(np.array([stamp["size"], stamp["mtime_ns"]], dtype=np.int64).tobytes())
+            f.write(np.array(seeds.shape, dtype=np.int32).tobytes())
+            f.write(np.ascontiguousarray(seeds, dtype=np.int32).tobytes())
+        os.replace(tmp, path)
+    except OSError:
+        pass  # read-only location: just skip the sidecar
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+def read_submission(
+    path: Union[str, Path],
+    k: int,
+    rounds: int = 50,
+    sidecar: bool = False,
+) -> np.ndarray:
+    """
+    Read a submission file with exactly (k * rounds) non-empty lines, each a
+    node id, as a (rounds, k) int32 array (row r = round r's seeds).
+
+    The file is parsed with one np.fromstring call. With sidecar=True the
+    array is also stored next to the file (<name>.seeds) and read back from
+    there while the text file keeps its size and mtime.
+    """
+    p = Path(path)
+    expected = k * rounds
+    side = p.with_suffix(SUBMISSION_SIDECAR_SUFFIX)
+    if sidecar:
+        stamp = _source_stamp(p, with_hash=False)
+        cached = _read_sidecar(side, stamp, k, rounds)
+        if cached is not None:
+            return cached
+
+    data = p.read_bytes()
+    try:
+        text = data.decode("ascii").strip()
+        nums = np.fromstring(text, dtype=np.int64, sep=" ") if text else np.zeros(0, dtype=np.int64)
+    except ValueError:
+        raise ValueError(f"{path}: expected one integer node id per line") from None
+    if not _one_token_per_line(data):
+        raise ValueError(f"{path}: expected one integer node id per line")
+
+    if len(nums) != expected:
+        raise ValueError(f"{path}: expected exactly {expected} lines, got {len(nums)}")
+    if nums.size and (int(nums.min()) < np.iinfo(np.int32).min or int(nums.max()) > np.iinfo(np.int32).max):
+        raise ValueError(f"{path}: node id out of range")
+    seeds = nums.astype(np.int32).reshape(rounds, k)
+    if sidecar:
+        _write_sidecar(side, stamp, seeds)
+    return seeds
 
 def _infer_family(comp: str, unique_id: int) -> Optional[str]:
     if comp == "RR":
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+import argparse
+import json
+from pathlib import Path
+
+from core.graph import load_graph
+from strategies.evaluate import evaluate_strategies
+
+
+DEFAULT_POOL = "random_k;top_degree_random_tie:top_m=2.0;degree_cluster"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo comparison of strategies against an opponent pool on one graph."
+    )
+    parser.add_argument("--graph", required=True, type=str, help="Graph JSON path.")
+    parser.add_argument("--candidates", required=True, type=str,
+                        help="Strategies to compare, separated by ';' (e.g. 'random_k;top_degree_avoid:top_m=3.0').")
+    parser.add_argument("--opponents", default=DEFAULT_POOL, type=str,
+                        help="Opponent pool, same format (default: random_k; top_degree_random_tie:top_m=2.0; degree_cluster).")
+    parser.add_argument("--k", default=None, type=int, help="Seeds per round (default: inferred from filename, else 5).")
+    parser.add_argument("--rounds", default=50, type=int, help="Rounds per match (default: 50).")
+    parser.add_argument("--seed", default=0, type=int, help="Base seed for strategies and caps.")
+    parser.add_argument("--min-trials", default=16, type=int, help="Trials before any early stop (default: 16).")
+    parser.add_argument("--max-trials", default=200, type=int, help="Trials per candidate at most (default: 200).")
+    parser.add_argument("--batch", default=8, type=int, help="Trials between stopping checks (default: 8).")
+    parser.add_argument("--z", default=1.96, type=float, help="CI half-width in standard errors (default: 1.96).")
+    parser.add_argument("--metric", default="win", choices=("win", "share"), help="Metric for early stopping (default: win).")
+    parser.add_argument("--workers", default=1, type=int, help="Worker processes (default: 1).")
+    parser.add_argument("--out", default=None, type=str, help="Optional JSON report path.")
+    args = parser.parse_args()
+
+    G = load_graph(args.graph)
+    k = args.k if args.k is not None else (G.k if G.k is not None else 5)
+    candidates = [c.strip() for c in args.candidates.split(";") if c.strip()]
+    opponents = [c.strip() for c in args.opponents.split(";") if c.strip()]
+
+    stats = evaluate_strategies(
+        args.graph, candidates, opponents, k,
+        rounds=args.rounds, seed=args.seed, min_trials=args.min_trials, max_trials=args.max_trials,
+        batch=args.batch, z=args.z, metric=args.metric, workers=args.workers, G=G,
+    )
+
+    report = []
+    print(f"\n=== {Path(args.graph).name}, k={k}, opponents: {', '.join(opponents)} ===")
+    for spec, s in sorted(stats.items(), key=lambda kv: -kv[1].win_rate(args.z)[0]):
+        w, w_var, (w_lo, w_hi) = s.win_rate(args.z)
+        sh, sh_var, (sh_lo, sh_hi) = s.node_share(args.z)
+        print(f"{spec}: trials={s.trials}  win={w:.3f} [{w_lo:.3f}, {w_hi:.3f}] var={w_var:.4f}  "
+              f"share={sh:.4f} [{sh_lo:.4f}, {sh_hi:.4f}] var={sh_var:.6f}")
+        for opp, rate in sorted(s.win_rate_by_opponent().items()):
+            print(f"    vs {opp}: win={rate:.3f}")
+        report.append({
+            "spec": spec, "trials": s.trials,
+            "win_mean": w, "win_var": w_var, "win_ci": [w_lo, w_hi],
+            "share_mean": sh, "share_var": sh_var, "share_ci": [sh_lo, sh_hi],
+            "win_by_opponent": s.win_rate_by_opponent(),
+        })
+
+    if args.out:
+        Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+        print(f"Wrote report to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,32 @@
 #!/usr/bin/env python3
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-import random
+import numpy as np
 
-from core.io import load_graph_json, infer_from_filename
-from core.graph import wrap_graph
-from sim.engine import simulate
+from core.io import infer_from_filename, read_submission
+from core.graph import GraphLike, load_graph
+from sim.engine import ENGINES, round_rng, simulate, simulate_batch
+from sim.profile import SimulationObserver, SimulationProfile, write_trace
 
+# --engine value that plays all rounds at once through simulate_batch
+BATCH = "batch"
 
-def read_submission_txt(path: str, k: int, rounds: int = 50) -> List[List[int]]:
+
+def read_submission_txt(path: str, k: int, rounds: int = 50, sidecar: bool = False) -> np.ndarray:
     """
     Read a submission file with exactly (k * rounds) lines, each a node id.
-    Returns: seeds_by_round[round_idx] = list of k ints
+    Returns: (rounds, k) int32 array, seeds_by_round[round_idx] = k seeds
+    (see core.io.read_submission for the sidecar cache)
     """
-    p = Path(path)
-    lines = [ln.strip() for ln in p.read_text(encoding="utf-8").splitlines() if ln.strip() != ""]
-    nums = [int(x) for x in lines]
+    return read_submission(path, k, rounds, sidecar=sidecar)
 
-    expected = k * rounds
-    if len(nums) != expected:
-        raise ValueError(f"{path}: expected exactly {expected} lines, got {len(nums)}")
 
-    out: List[List[int]] = []
-    for r in range(rounds):
-        out.append(nums[r * k : (r + 1) * k])
-    return out
+def round_caps(seed: int, rounds: int) -> List[int]:
+    """Random cap of every round, drawn as simulate() does from round_rng(seed, r)."""
+    return [round_rng(seed, r).randint(100, 200) for r in range(rounds)]
 
 
 def infer_graph_path_from_submission(sub_path: str) -> Optional[str]:
@@ -55,6 +55,130 @@ def infer_graph_path_from_submission(sub_path: str) -> Optional[str]:
     return None
 
 
+def play_round(
+    G: GraphLike,
+    seeds_this_round: List[List[int]],
+    seed: int,
+    round_idx: int,
+    engine: str,
+    observer: Optional[SimulationObserver] = None,
+) -> List[int]:
+    """Simulate one round with its own (seed, round)-derived RNG; returns scores."""
+    res = simulate(G, seeds_by_team=seeds_this_round, rng=round_rng(seed, round_idx), engine=engine, observer=observer)
+    return res.scores
+
+
+def tally_rounds(scores_by_round: List[List[int]]) -> Tuple[List[int], List[int], int, List[int]]:
+    """Aggregate per-round scores into (totals, round_wins, tie_rounds, best).
+
+    A round is won by the unique top scorer (shared tops count as a tie round).
+    best lists the overall leaders: most round wins, ties broken by totals;
+    it has more than one entry only on an exact tie in both.
+    """
+    T = len(scores_by_round[0]) if scores_by_round else 0
+    totals = [0] * T
+    round_wins = [0] * T
+    tie_rounds = 0
+
+    for scores in scores_by_round:
+        # accumulate scores
+        for t in range(T):
+            totals[t] += scores[t]
+
+        # determine round winner(s)
+        max_score = max(scores)
+        winners = [t for t, sc in enumerate(scores) if sc == max_score]
+        if len(winners) == 1:
+            round_wins[winners[0]] += 1
+        else:
+            tie_rounds += 1
+
+    # overall winner: most round wins, break ties by totals
+    max_round_wins = max(round_wins) if T else 0
+    best = [t for t in range(T) if round_wins[t] == max_round_wins]
+    if len(best) > 1:
+        max_total = max(totals[t] for t in best)
+        best = [t for t in best if totals[t] == max_total]
+    return totals, round_wins, tie_rounds, best
+
+
+# per-worker graph, opened once from the memory-mapped cache by the initializer
+_WORKER_GRAPH: Optional[GraphLike] = None
+
+
+def _init_worker(graph_path: str) -> None:
+    global _WORKER_GRAPH
+    _WORKER_GRAPH = load_graph(graph_path)
+
+
+def _play_round_worker(
+    seeds_this_round: List[List[int]],
+    seed: int,
+    round_idx: int,
+    engine: str,
+    profile: bool,
+) -> Tuple[List[int], Optional[SimulationProfile]]:
+    prof = SimulationProfile() if profile else None
+    return play_round(_WORKER_GRAPH, seeds_this_round, seed, round_idx, engine, prof), prof
+
+
+def _play_batch_worker(seeds_by_round: np.ndarray, caps: List[int]) -> np.ndarray:
+    return simulate_batch(_WORKER_GRAPH, seeds_by_round, caps=caps, scores_only=True)
+
+
+def play_rounds(
+    G: GraphLike,
+    graph_path: str,
+    seeds_by_round: np.ndarray,
+    seed: int,
+    engine: str,
+    workers: int = 1,
+    profile: bool = False,
+) -> Tuple[List[List[int]], Optional[List[SimulationProfile]]]:
+    """(scores for every round, per-round profiles if profile), in round order.
+
+    seeds_by_round is a (rounds, teams, k) int array. The batch engine plays
+    all rounds at once with simulate_batch, using the same per-round caps as
+    play_round; profiling needs per-generation callbacks, so it falls back to
+    the numpy engine there.
+
+    With workers > 1 rounds are spread over a process pool. Each worker opens
+    the graph once through load_graph (mmap'd binary cache) instead of having
+    it pickled per task; results do not depend on the worker count.
+    """
+    if engine == BATCH and not profile:
+        caps = round_caps(seed, len(seeds_by_round))
+        if workers <= 1:
+            scores = simulate_batch(G, seeds_by_round, caps=caps, scores_only=True)
+        else:
+            chunks = [c for c in np.array_split(np.arange(len(seeds_by_round)), workers) if c.size]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(graph_path,)) as pool:
+                futures = [
+                    pool.submit(_play_batch_worker, seeds_by_round[c], [caps[r] for r in c])
+                    for c in chunks
+                ]
+                scores = np.concatenate([f.result() for f in futures])
+        return scores.tolist(), None
+    if engine == BATCH:
+        engine = "numpy"
+
+    if workers <= 1:
+        results = []
+        for r, seeds in enumerate(seeds_by_round):
+            prof = SimulationProfile() if profile else None
+            results.append((play_round(G, seeds.tolist(), seed, r, engine, prof), prof))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(graph_path,)) as pool:
+            futures = [
+                pool.submit(_play_round_worker, seeds.tolist(), seed, r, engine, profile)
+                for r, seeds in enumerate(seeds_by_round)
+            ]
+            results = [f.result() for f in futures]
+
+    scores_by_round = [scores for scores, _ in results]
+    return scores_by_round, ([prof for _, prof in results] if profile else None)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Simulate 2-5 submissions competing on the same graph (50 rounds)."
@@ -70,7 +194,12 @@ def main() -> None:
     parser.add_argument("--graph", default=None, type=str, help="Graph JSON path (optional; inferred if omitted).")
     parser.add_argument("--rounds", default=50, type=int, help="Number of rounds (default: 50).")
     parser.add_argument("--k", default=None, type=int, help="Seeds per round (optional; inferred from filename).")
-    parser.add_argument("--seed", default=0, type=int, help="RNG seed for random cap inside simulate().")
+    parser.add_argument("--seed", default=0, type=int, help="RNG seed for random cap inside simulate() (one derived RNG per round).")
+    parser.add_argument("--engine", default=BATCH, choices=ENGINES + (BATCH,),
+                        help="Simulation engine; 'batch' plays all rounds at once (default: batch).")
+    parser.add_argument("--workers", default=1, type=int, help="Worker processes for simulating rounds in parallel (default: 1).")
+    parser.add_argument("--profile", default=None, type=str,
+                        help="Write a per-generation trace of every round here (CSV if it ends in .csv, else JSON).")
     args = parser.parse_args()
 
     # Gather submissions (2..6)
@@ -116,51 +245,20 @@ def main() -> None:
             print(f"[Info] Inferred k={k} from filename.")
 
     # Load graph
-    G_nx = load_graph_json(graph_path)
-    G = wrap_graph(G_nx, graph_path)
-
-    # Read seeds for each team: seeds_by_team[team][round] = [k seeds]
-    seeds_by_team: List[List[List[int]]] = []
-    for s in subs:
-        seeds_by_team.append(read_submission_txt(s, k=k, rounds=args.rounds))
+    G = load_graph(graph_path)
 
-    # Validate seeds
-    for t in range(len(subs)):
-        for r in range(args.rounds):
-            G.validate_seeds(seeds_by_team[t][r])
+    # Read seeds for each team: (rounds, teams, k), seeds_by_round[round][team] = k seeds
+    seeds_by_round = np.stack([read_submission_txt(s, k=k, rounds=args.rounds) for s in subs], axis=1)
 
-    rng = random.Random(args.seed)
+    # Validate seeds (every team and round at once)
+    G.validate_seeds(seeds_by_round)
 
     T = len(subs)
-    totals = [0] * T
-    round_wins = [0] * T
-    tie_rounds = 0
-
-    for r in range(args.rounds):
-        seeds_this_round = [seeds_by_team[t][r] for t in range(T)]
-        res = simulate(G, seeds_by_team=seeds_this_round, record_history=False, rng=rng)
-
-        # accumulate scores
-        for t in range(T):
-            totals[t] += res.scores[t]
-
-        # determine round winner(s)
-        max_score = max(res.scores)
-        winners = [t for t, sc in enumerate(res.scores) if sc == max_score]
-        if len(winners) == 1:
-            round_wins[winners[0]] += 1
-        else:
-            tie_rounds += 1
-
-    # overall winner: most round wins, break ties by totals
-    max_round_wins = max(round_wins)
-    best = [t for t in range(T) if round_wins[t] == max_round_wins]
-    if len(best) == 1:
-        overall = best[0]
-    else:
-        max_total = max(totals[t] for t in best)
-        best2 = [t for t in best if totals[t] == max_total]
-        overall = best2[0]  # deterministic pick
+    scores_by_round, profiles = play_rounds(
+        G, graph_path, seeds_by_round, args.seed, args.engine, workers=args.workers, profile=args.profile is not None
+    )
+    totals, round_wins, tie_rounds, best = tally_rounds(scores_by_round)
+    overall = best[0]  # deterministic pick
 
     print("\n=== Summary ===")
     print(f"Graph: {graph_path}")
@@ -171,6 +269,17 @@ def main() -> None:
     print(f"tie_rounds={tie_rounds}")
     print(f"Overall winner: team{overall}")
 
+    if profiles is not None:
+        write_trace(args.profile, profiles)
+        gens = sum(p.num_generations for p in profiles)
+        update_sec = sum(g.seconds for p in profiles for g in p.generations)
+        sim_sec = sum(p.seconds for p in profiles)
+        cycles = sum(p.cycle is not None for p in profiles)
+        print("\n=== Profile ===")
+        print(f"simulate: {sim_sec:.3f}s over {args.rounds} rounds, {gens} generations "
+              f"({update_sec:.3f}s in updates, {cycles} rounds ended by cycle detection)")
+        print(f"Wrote trace to {args.profile}")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
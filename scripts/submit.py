@@ -3,14 +3,20 @@ from __future__ import annotations
 
 import argparse
 import random
+from dataclasses import replace
 from pathlib import Path
 
-from core.io import load_graph_json, write_submission_txt, infer_from_filename
-from core.graph import Graph, wrap_graph
+from core.io import write_submission_txt, infer_from_filename
+from core.graph import load_graph
 from strategies.base import StrategyContext
 from strategies.baselines import get_strategy
 
 
+def _spec_tag(spec: str) -> str:
+    """Filename-safe form of a 'name:key=value,...' strategy spec."""
+    return spec.strip().replace(":", "-").replace("=", "").replace(",", "_")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Generate Pandemaniac seed submission file.")
     parser.add_argument("--graph", required=True, type=str, help="Path to input JSON graph.")
@@ -25,13 +31,30 @@ def main() -> None:
     # top_degree stratrgy 
     parser.add_argument("--top-m", type=float, default=1, help="Top-M pool size ratio for top_degree_random_tie and top_degree_avoid. (>=1)")
 
+    # simulated_greedy strategy
+    parser.add_argument("--opponent", type=str, default="top_degree_random_tie:top_m=2.0",
+                        help="Opponent model for simulated_greedy and local_swap, as 'name:key=value,...'.")
+    parser.add_argument("--samples", type=int, default=4, help="Opponent seed sets sampled per round by simulated_greedy and local_swap.")
+    parser.add_argument("--pool-m", type=float, default=5.0, help="Candidate pool size ratio (top pool_m * k by degree) for simulated_greedy and local_swap.")
+
+    # local_swap strategy
+    parser.add_argument("--base-strategy", type=str, default="top_degree_random_tie:top_m=2.0",
+                        help="Strategy whose seeds local_swap refines, as 'name:key=value,...'.")
+    parser.add_argument("--max-evals", type=int, default=200, help="Swaps tried per round by local_swap.")
+    parser.add_argument("--batch", type=int, default=8, help="Swaps local_swap scores together in one batch.")
+
     args = parser.parse_args()
 
-    G_nx = load_graph_json(args.graph)
-    G = wrap_graph(G_nx, args.graph)    # metadata has been inferred here: comp, k, family
+    G = load_graph(args.graph)    # metadata has been inferred here: comp, k, family
 
     if args.strategy == "top_degree_random_tie" or args.strategy == "top_degree_avoid":
         strat = get_strategy(args.strategy, top_m=args.top_m)
+    elif args.strategy == "simulated_greedy":
+        strat = get_strategy(args.strategy, opponent=args.opponent, samples=args.samples, pool_m=args.pool_m)
+    elif args.strategy == "local_swap":
+        strat = get_strategy(args.strategy, base=args.base_strategy, opponent=args.opponent,
+                             samples=args.samples, max_evals=args.max_evals, pool_m=args.pool_m,
+                             batch=args.batch)
     else:
         strat = get_strategy(args.strategy)
     rng = random.Random(args.seed)
@@ -42,21 +65,21 @@ def main() -> None:
     if is_generated:
         # Test mode: do not infer k from filename
         if args.k is None:
-            G = wrap_graph(G_nx, args.graph, meta_override={"k": 5})
+            G = replace(G, k=5)
             print(f"Generated graph detected. Using default k={G.k}.")
         else:
-            G = wrap_graph(G_nx, args.graph, meta_override={"k": args.k})
+            G = replace(G, k=args.k)
     else:
         # Competition mode: infer k, allow override
         if args.k is not None:
             if G.k is not None and args.k != G.k:
                 print(f"Warning: Provided k={args.k} differs from inferred k={G.k} from filename.")
-            G = wrap_graph(G_nx, args.graph, meta_override={"k": args.k})  # override for validation
+            G = replace(G, k=args.k)  # override for validation
         elif G.k is not None:
             k = G.k
             print(f"Inferred k={k} from filename.")
         else:
-            G = wrap_graph(G_nx, args.graph, meta_override={"k": 5})  # default fallback
+            G = replace(G, k=5)  # default fallback
             print(f"Could not infer k from filename. Using default k={G.k}.")
 
     seeds_by_round = strat.select_seeds_50(G, G.k, rng, ctx, rounds=args.rounds)
@@ -65,10 +88,17 @@ def main() -> None:
     for r, seeds in enumerate(seeds_by_round):
         if len(seeds) != G.k:
             raise ValueError(f"Round {r}: expected {G.k} seeds, got {len(seeds)}")
-        G.validate_seeds(seeds)
+    G.validate_seeds(seeds_by_round)
 
     if args.strategy == "top_degree_avoid" or args.strategy == "top_degree_random_tie":
         out_filename = f"{Path(args.graph).stem}/{args.strategy}_topm{args.top_m}_seed{args.seed}.txt"
+    elif args.strategy == "simulated_greedy":
+        out_filename = (f"{Path(args.graph).stem}/{args.strategy}_opp{_spec_tag(args.opponent)}"
+                        f"_samples{args.samples}_poolm{args.pool_m}_seed{args.seed}.txt")
+    elif args.strategy == "local_swap":
+        out_filename = (f"{Path(args.graph).stem}/{args.strategy}_base{_spec_tag(args.base_strategy)}"
+                        f"_opp{_spec_tag(args.opponent)}_samples{args.samples}_poolm{args.pool_m}"
+                        f"_evals{args.max_evals}_batch{args.batch}_seed{args.seed}.txt")
     else:
         out_filename = f"{Path(args.graph).stem}/{args.strategy}_seed{args.seed}.txt"
     out_path = Path(args.out_dir) / out_filename
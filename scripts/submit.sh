@@ -30,6 +30,28 @@ python3 -m scripts.submit \
   --strategy random_k \
   --seed 2
 
+# # simulated greedy strategy (about 3 s per round at 5k nodes and k=20,
+# # so roughly 160 s for a 50-round submission with these defaults)
+# python3 -m scripts.submit \
+#   --graph graphs/J.20.31.json \
+#   --strategy simulated_greedy \
+#   --opponent top_degree_random_tie:top_m=2.0 \
+#   --samples 4 \
+#   --pool-m 5.0 \
+#   --seed 2
+
+# # local swap strategy: refines --base-strategy's seeds (about 4 s per round
+# # at 5k nodes and k=20 with these defaults)
+# python3 -m scripts.submit \
+#   --graph graphs/J.20.31.json \
+#   --strategy local_swap \
+#   --base-strategy degree_cluster \
+#   --opponent top_degree_random_tie:top_m=2.0 \
+#   --samples 4 \
+#   --pool-m 5.0 \
+#   --max-evals 200 \
+#   --seed 2
+
 # # degree cluster strategy
 # python3 -m scripts.submit \
 #   --graph graphs/J.20.31.json \
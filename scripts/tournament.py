@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+import argparse
+import csv
+import itertools
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.io import infer_from_filename
+from core.graph import GraphLike, load_graph
+from sim.engine import ENGINES
+from scripts.simulate_submissions import (
+    BATCH,
+    infer_graph_path_from_submission,
+    play_rounds,
+    read_submission_txt,
+    tally_rounds,
+)
+
+
+# per-worker graphs, each opened once (mmap'd binary cache) on first use
+_WORKER_GRAPHS: Dict[str, GraphLike] = {}
+
+
+def _get_graph(graph_path: str) -> GraphLike:
+    G = _WORKER_GRAPHS.get(graph_path)
+    if G is None:
+        G = load_graph(graph_path)
+        _WORKER_GRAPHS[graph_path] = G
+    return G
+
+
+def play_match(
+    graph_path: str,
+    seeds_by_round: np.ndarray,
+    seed: int,
+    engine: str,
+) -> List[List[int]]:
+    """Play all rounds of one (rounds, teams, k) match; returns scores_by_round."""
+    G = _get_graph(graph_path)
+    scores_by_round, _ = play_rounds(G, graph_path, seeds_by_round, seed, engine)
+    return scores_by_round
+
+
+def discover(sub_dir: Path) -> Dict[str, List[Path]]:
+    """submissions/<graph>/*.txt -> {graph_name: [submission paths]}"""
+    out: Dict[str, List[Path]] = {}
+    for graph_dir in sorted(p for p in sub_dir.iterdir() if p.is_dir()):
+        subs = sorted(graph_dir.glob("*.txt"))
+        if len(subs) >= 2:
+            out[graph_dir.name] = subs
+    return out
+
+
+def pairwise_outcome(round_wins: Sequence[int], totals: Sequence[int], i: int, j: int) -> float:
+    """Score of team i against team j in a finished match: 1 win, 0.5 draw, 0 loss.
+
+    Uses the same order as the overall winner: round wins, then totals.
+    """
+    a = (round_wins[i], totals[i])
+    b = (round_wins[j], totals[j])
+    if a > b:
+        return 1.0
+    if a == b:
+        return 0.5
+    return 0.0
+
+
+def elo_ratings(
+    matches: List[Dict[str, Any]],
+    players: List[str],
+    k_factor: float = 32.0,
+    base: float = 1500.0,
+) -> Dict[str, float]:
+    """Sequential Elo over all pairwise results, in deterministic match order."""
+    rating = {p: base for p in players}
+    for m in matches:
+        names = m["players"]
+        delta = {p: 0.0 for p in names}
+        for i, j in itertools.combinations(range(len(names)), 2):
+            a, b = names[i], names[j]
+            s = pairwise_outcome(m["round_wins"], m["totals"], i, j)
+            expected = 1.0 / (1.0 + 10 ** ((rating[b] - rating[a]) / 400.0))
+            delta[a] += k_factor * (s - expected)
+            delta[b] -= k_factor * (s - expected)
+        for p, d in delta.items():
+            rating[p] += d
+    return rating
+
+
+def bradley_terry(
+    wins: Dict[Tuple[str, str], float],
+    games: Dict[Tuple[str, str], float],
+    players: List[str],
+    prior: float = 0.5,
+    iters: int = 500,
+    tol: float = 1e-9,
+) -> Dict[str, float]:
+    """Bradley-Terry strengths via the MM algorithm (Hunter, 2004).
+
+    Every pair that met gets `prior` extra drawn games so undefeated or
+    winless players keep finite strengths. Strengths are normalized to
+    geometric mean 1.
+    """
+    p = {x: 1.0 for x in players}
+    for _ in range(iters):
+        new: Dict[str, float] = {}
+        for i in players:
+            w_i = 0.0
+            denom = 0.0
+            for j in players:
+                n_ij = games.get((i, j), 0.0)
+                if i == j or n_ij == 0:
+                    continue
+                w_i += wins.get((i, j), 0.0) + prior / 2.0
+                denom += (n_ij + prior) / (p[i] + p[j])
+            new[i] = w_i / denom if denom > 0 else p[i]
+        log_mean = sum(math.log(v) for v in new.values() if v > 0) / max(1, len(new))
+        scale = math.exp(log_mean)
+        new = {x: v / scale for x, v in new.items()}
+        diff = max(abs(new[x] - p[x]) for x in players) if players else 0.0
+        p = new
+        if diff < tol:
+            break
+    return p
+
+
+def _write_csv(path: Path, header: List[str], rows: List[List[Any]]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Round-robin tournament over submissions/<graph>/*.txt across all graphs."
+    )
+    parser.add_argument("--sub-dir", default="submissions", type=str, help="Root of submissions/<graph>/*.txt.")
+    parser.add_argument("--out-dir", default="results/tournament", type=str, help="Directory for result tables.")
+    parser.add_argument("--nway", default=None, type=int, help="Also play every N-way match (N>=3, optional).")
+    parser.add_argument("--rounds", default=50, type=int, help="Number of rounds (default: 50).")
+    parser.add_argument("--k", default=None, type=int, help="Seeds per round (default: inferred from graph filename, else 5).")
+    parser.add_argument("--seed", default=0, type=int, help="RNG seed (one derived RNG per round).")
+    parser.add_argument("--engine", default=BATCH, choices=ENGINES + (BATCH,),
+                        help="Simulation engine; 'batch' plays all rounds of a match at once (default: batch).")
+    parser.add_argument("--workers", default=1, type=int, help="Worker processes (default: 1).")
+    parser.add_argument("--sidecar", action="store_true",
+                        help="Cache parsed submissions next to them (<name>.seeds) for later tournaments.")
+    args = parser.parse_args()
+
+    if args.nway is not None and args.nway < 3:
+        raise ValueError("--nway must be >= 3 (pairwise matches are always played).")
+
+    graphs = discover(Path(args.sub_dir))
+    if not graphs:
+        raise ValueError(f"No graph directories with >= 2 submissions under {args.sub_dir}.")
+
+    # Schedule: one task per match, grouped by graph so workers reuse loaded graphs.
+    tasks: List[Tuple[str, str, Optional[str], List[str], np.ndarray]] = []
+    played = 0  # graphs not skipped below
+    for graph_name, subs in graphs.items():
+        graph_path = infer_graph_path_from_submission(str(subs[0]))
+        if graph_path is None:
+            print(f"[Warn] Skipping {graph_name}: graph file not found.")
+            continue
+        comp, k_inferred, family = infer_from_filename(graph_path)
+        k = args.k if args.k is not None else (k_inferred if k_inferred is not None else 5)
+
+        played += 1
+        G = load_graph(graph_path)  # also writes the binary cache the workers open
+        seeds: Dict[str, np.ndarray] = {}
+        for s in subs:
+            seeds_by_round = read_submission_txt(str(s), k=k, rounds=args.rounds, sidecar=args.sidecar)
+            G.validate_seeds(seeds_by_round)
+            seeds[s.stem] = seeds_by_round
+
+        names = sorted(seeds)
+        sizes = [2] + ([args.nway] if args.nway is not None and args.nway <= len(names) else [])
+        for size in sizes:
+            for group in itertools.combinations(names, size):
+                # (rounds, teams, k)
+                tasks.append((graph_name, graph_path, family, list(group),
+                              np.stack([seeds[x] for x in group], axis=1)))
+
+    print(f"[Info] {len(tasks)} matches on {played} graphs, workers={args.workers}")
+
+    if args.workers <= 1:
+        results = [play_match(t[1], t[4], args.seed, args.engine) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [pool.submit(play_match, t[1], t[4], args.seed, args.engine) for t in tasks]
+            results = [f.result() for f in futures]
+
+    matches: List[Dict[str, Any]] = []
+    for (graph_name, graph_path, family, names, _), scores_by_round in zip(tasks, results):
+        totals, round_wins, tie_rounds, best = tally_rounds(scores_by_round)
+        matches.append({
+            "graph": graph_name,
+            "family": family,
+            "players": names,
+            "totals": totals,
+            "round_wins": round_wins,
+            "tie_rounds": tie_rounds,
+            "winner": names[best[0]] if len(best) == 1 else None,
+        })
+
+    players = sorted({p for m in matches for p in m["players"]})
+    wins: Dict[Tuple[str, str], float] = {}
+    games: Dict[Tuple[str, str], float] = {}
+    # family -> player -> [points, games]
+    by_family: Dict[str, Dict[str, List[float]]] = {}
+    for m in matches:
+        names = m["players"]
+        fam = m["family"] or "unknown"
+        for i, j in itertools.permutations(range(len(names)), 2):
+            s = pairwise_outcome(m["round_wins"], m["totals"], i, j)
+            key = (names[i], names[j])
+            wins[key] = wins.get(key, 0.0) + s
+            games[key] = games.get(key, 0.0) + 1
+            rec = by_family.setdefault(fam, {}).setdefault(names[i], [0.0, 0.0])
+            rec[0] += s
+            rec[1] += 1
+
+    elo = elo_ratings(matches, players)
+    bt = bradley_terry(wins, games, players)
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    _write_csv(
+        out_dir / "matches.csv",
+        ["graph", "family", "players", "totals", "round_wins", "tie_rounds", "winner"],
+        [[m["graph"], m["family"], " ".join(m["players"]), " ".join(map(str, m["totals"])),
+          " ".join(map(str, m["round_wins"])), m["tie_rounds"], m["winner"] or ""] for m in matches],
+    )
+    # win_matrix[i][j] = points of row player against column player
+    _write_csv(
+        out_dir / "win_matrix.csv",
+        ["player"] + players,
+        [[a] + [f"{wins.get((a, b), 0.0):g}/{games.get((a, b), 0.0):g}" if a != b else "" for b in players]
+         for a in players],
+    )
+    ranked = sorted(players, key=lambda p: (-bt[p], -elo[p], p))
+    _write_csv(
+        out_dir / "ratings.csv",
+        ["player", "elo", "bt_strength", "bt_rating", "points", "games"],
+        [[p, f"{elo[p]:.1f}", f"{bt[p]:.4f}", f"{400 * math.log10(bt[p]) + 1500:.1f}",
+          f"{sum(v for (a, _), v in wins.items() if a == p):g}",
+          f"{sum(v for (a, _), v in games.items() if a == p):g}"] for p in ranked],
+    )
+    _write_csv(
+        out_dir / "families.csv",
+        ["family", "player", "points", "games", "win_rate"],
+        [[fam, p, f"{pts:g}", f"{n:g}", f"{pts / n:.3f}"]
+         for fam in sorted(by_family) for p, (pts, n) in sorted(by_family[fam].items())],
+    )
+    with (out_dir / "matches.json").open("w", encoding="utf-8") as f:
+        json.dump(matches, f, indent=1)
+
+    print("\n=== Ratings ===")
+    for p in ranked:
+        print(f"{p}: elo={elo[p]:.1f}  bt={bt[p]:.3f}")
+    print(f"Wrote tables to {out_dir.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+# round-robin over every submissions/<graph>/*.txt (run submit.sh first)
+# results go to results/tournament/ (win matrix, Elo / Bradley-Terry ratings, per-family table)
+
+python3 -m scripts.tournament \
+  --sub-dir submissions \
+  --workers 4 \
+  --seed 0
+
+# # also play every 3-way match
+# python3 -m scripts.tournament \
+#   --sub-dir submissions \
+#   --nway 3 \
+#   --workers 4
@@ -1,11 +1,39 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Deque, List, Optional, Sequence, Tuple, Union
 import random
+import time
 
-from core.graph import Graph
-from sim.rules import UNCOLORED, apply_seed_conflicts, update_node
+import numpy as np
+
+from core.graph import GraphLike
+from sim.history import SimulationHistory
+from sim.profile import GenerationStats, SimulationObserver
+from sim.rules import (
+    UNCOLORED, initial_colors, initial_colors_batch, update_node, update_colors_batch, update_colors_csr, vote_slots,
+)
+
+
+# "reference" walks nodes in Python (mirrors samples/sim_TA.py line by line);
+# "numpy" runs the same rule vectorized over the CSR adjacency;
+# "frontier" only re-evaluates nodes next to last generation's changes.
+ENGINES = ("reference", "numpy", "frontier")
+
+
+# longest oscillation period the numpy/frontier engines look for; longer
+# cycles simply run until the cap
+_MAX_PERIOD = 8
+
+
+def round_rng(seed: int, round_idx: int) -> random.Random:
+    """Independent RNG for one round, derived only from (seed, round index).
+
+    String seeds are hashed with SHA-512 by `random`, so this is stable across
+    processes and Python hash randomization.
+    """
+    return random.Random(f"{seed}:{round_idx}")
 
 
 @dataclass
@@ -13,50 +41,105 @@ class SimulationResult:
     final_colors: List[int]          # length n, values in {-1, 0..T-1}
     num_generations: int             # number of update generations executed
     scores: List[int]                # nodes owned per team
-    history: Optional[List[List[int]]] = None  # optional snapshots per generation
+    history: Optional[SimulationHistory] = None  # optional per-generation states (delta-encoded)
 
 
 def simulate(
-    G: Graph,
+    G: GraphLike,
     seeds_by_team: List[List[int]],
     *,
     record_history: bool = False,
     rng: Optional[random.Random] = None,
+    engine: str = "reference",
+    observer: Optional[SimulationObserver] = None,
+    history_path: Optional[str] = None,
 ) -> SimulationResult:
     """Run competing epidemic simulation until stable (or random cap like TA).
 
     seeds_by_team: list of seed lists, one per team.
                    Team ids are 0..T-1 by list index.
+    engine: one of ENGINES. All engines return identical results for the
+            same inputs and rng state.
+    observer: optional SimulationObserver (e.g. sim.profile.SimulationProfile)
+              notified once per generation with timing, change and team counts.
+    record_history: keep every generation's state as a SimulationHistory
+                    (initial colors plus per-generation changes).
+    history_path: stream that history to this file instead of memory
+                  (implies record_history).
     """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine} (expected one of {ENGINES})")
     if rng is None:
         rng = random.Random()
 
     T = len(seeds_by_team)
     # Resolve conflicts (nobody gets collided seed nodes)
-    seeds_by_team = apply_seed_conflicts(seeds_by_team)
-
-    colors = [UNCOLORED] * G.n
-    for t, seeds in enumerate(seeds_by_team):
-        for s in seeds:
-            colors[int(s)] = t
+    init = initial_colors(G.n, seeds_by_team)
+    colors = init if engine == "numpy" else init.tolist()
 
-    generation = 1
-    prev: Optional[List[int]] = None
     max_rounds = rng.randint(100, 200)  # TA uses randint(100, 200)
 
-    history: Optional[List[List[int]]] = [] if record_history else None
+    history = None
+    if record_history or history_path is not None:
+        history = SimulationHistory(colors, path=history_path)
 
-    def is_stable(gen: int, max_r: int, prev_state: Optional[List[int]], curr_state: List[int]) -> bool:
-        if gen <= 1 or prev_state is None:
-            return False
-        if gen == max_r:
-            return True
-        return prev_state == curr_state
+    if observer is not None:
+        observer.on_start(engine, G.n, T, max_rounds, _team_counts(colors, T))
+    if engine == "numpy":
+        res = _simulate_numpy(G, colors, T, max_rounds, history, observer)
+    elif engine == "frontier":
+        res = _simulate_frontier(G, colors, T, max_rounds, history, observer)
+    else:
+        res = _simulate_reference(G, colors, T, max_rounds, history, observer)
+    if history is not None:
+        history.close()
+        res.history = history
+    if observer is not None:
+        observer.on_end(res.num_generations, res.scores)
+    return res
+
+
+def _team_counts(colors: List[int], T: int) -> List[int]:
+    counts = [0] * T
+    for c in colors:
+        if c != UNCOLORED:
+            counts[c] += 1
+    return counts
+
+
+def _is_stable(gen: int, max_r: int, prev_state, curr_state) -> bool:
+    if gen <= 1 or prev_state is None:
+        return False
+    if gen == max_r:
+        return True
+    return prev_state == curr_state
 
-    while not is_stable(generation, max_rounds, prev, colors):
+
+def _cycle_state(gen: int, period: int, max_rounds: int, x: int) -> int:
+    """Generation whose state equals generation x's, once S_gen == S_(gen - period).
+
+    From gen - period on the run repeats with that period, so the capped run
+    ends (at x = max_rounds) in the state of a generation in [gen - period, gen).
+    """
+    start = gen - period
+    return start + (x - start) % period
+
+
+def _simulate_reference(
+    G: GraphLike,
+    colors: List[int],
+    T: int,
+    max_rounds: int,
+    history: Optional[SimulationHistory] = None,
+    observer: Optional[SimulationObserver] = None,
+) -> SimulationResult:
+    generation = 1
+    prev: Optional[List[int]] = None
+
+    while not _is_stable(generation, max_rounds, prev, colors):
         prev = colors[:]  # snapshot
-        if record_history:
-            history.append(prev[:])
+        if observer is not None:
+            t0 = time.perf_counter()
 
         for u in range(G.n):
             changed, new_color = update_node(u, prev, G.neighbors[u])
@@ -64,10 +147,173 @@ def simulate(
                 colors[u] = new_color
 
         generation += 1
+        if observer is not None:
+            observer.on_generation(GenerationStats(
+                generation, time.perf_counter() - t0,
+                sum(a != b for a, b in zip(prev, colors)), G.n, _team_counts(colors, T),
+            ))
+        if history is not None:
+            changed_nodes = [u for u in range(G.n) if prev[u] != colors[u]]
+            history.record(changed_nodes, [colors[u] for u in changed_nodes])
+
+    scores = [0] * T
+    for c in colors:
+        if c != UNCOLORED:
+            scores[c] += 1
+
+    return SimulationResult(
+        final_colors=colors,
+        num_generations=generation,
+        scores=scores,
+    )
+
+
+def _simulate_numpy(
+    G: GraphLike,
+    colors: List[int],
+    T: int,
+    max_rounds: int,
+    history: Optional[SimulationHistory] = None,
+    observer: Optional[SimulationObserver] = None,
+) -> SimulationResult:
+    indptr, indices = G.csr
+    degrees = np.diff(indptr)
+    slots = vote_slots(np.repeat(np.arange(G.n, dtype=np.int32), degrees), T)
+
+    curr = np.asarray(colors, dtype=np.int32)
+    generation = 1
+    prev: Optional[np.ndarray] = None
+    # (hash, state) of the last generations before curr, oldest first
+    recent: Deque[Tuple[int, np.ndarray]] = deque(maxlen=_MAX_PERIOD)
+
+    def is_stable(gen: int) -> bool:
+        if gen <= 1 or prev is None:
+            return False
+        if gen == max_rounds:
+            return True
+        return bool(np.array_equal(prev, curr))
+
+    while not is_stable(generation):
+        # a state seen `period` generations ago (hash match, then exact check)
+        # repeats until the cap, so jump to the state the cap lands on
+        h = hash(curr.tobytes())
+        period = next(
+            (back for back, (h_old, old) in enumerate(reversed(recent), 1) if h_old == h and np.array_equal(old, curr)),
+            0,
+        )
+        if period:
+            if observer is not None:
+                observer.on_cycle(generation, period)
+            states = {generation - back: old for back, (_, old) in enumerate(reversed(recent), 1)}
+            if history is not None:
+                history.repeat_last(period, max_rounds)
+            curr = states[_cycle_state(generation, period, max_rounds, max_rounds)]
+            generation = max_rounds
+            break
+        recent.append((h, curr))
+
+        prev = curr
+        if observer is not None:
+            t0 = time.perf_counter()
+        curr = update_colors_csr(prev, slots, indices, degrees, T)
+        generation += 1
+        if observer is not None:
+            observer.on_generation(GenerationStats(
+                generation, time.perf_counter() - t0,
+                int(np.count_nonzero(prev != curr)), G.n, np.bincount(curr + 1, minlength=T + 1)[1:].tolist(),
+            ))
+        if history is not None:
+            changed_nodes = np.flatnonzero(prev != curr)
+            history.record(changed_nodes, curr[changed_nodes])
 
-    # final snapshot
-    if record_history and history is not None:
-        history.append(colors[:])
+    scores = np.bincount(curr[curr != UNCOLORED], minlength=T)[:T].tolist()
+
+    return SimulationResult(
+        final_colors=curr.tolist(),
+        num_generations=generation,
+        scores=scores,
+    )
+
+
+def _simulate_frontier(
+    G: GraphLike,
+    colors: List[int],
+    T: int,
+    max_rounds: int,
+    history: Optional[SimulationHistory] = None,
+    observer: Optional[SimulationObserver] = None,
+) -> SimulationResult:
+    """Incremental engine: a node's next color depends only on its own and its
+    neighbors' colors, so after the first generation only nodes adjacent to
+    (or equal to) a node that changed can change. Updates are computed from the
+    unmodified state and applied afterwards, which keeps generations synchronous
+    without copying the color list. An empty change set is exactly prev == curr.
+
+    Oscillations are caught with an incremental hash of the state (XOR of
+    hash((node, color)) over nodes that differ from the start); a hash match
+    with a state up to _MAX_PERIOD generations back is confirmed from the
+    change lists before jumping to the state the cap lands on.
+    """
+    neighbors = G.neighbors
+    generation = 1
+    state_hash = 0
+    # (hash of the state before, its (node, old, new) changes) per generation, oldest first
+    recent: Deque[Tuple[int, List[Tuple[int, int, int]]]] = deque(maxlen=_MAX_PERIOD)
+
+    counts = _team_counts(colors, T) if observer is not None else None
+
+    frontier = range(G.n)
+    while True:
+        if observer is not None:
+            t0 = time.perf_counter()
+
+        updates = []
+        for u in frontier:
+            changed, new_color = update_node(u, colors, neighbors[u])
+            if changed and new_color != colors[u]:
+                updates.append((u, colors[u], new_color))
+        recent.append((state_hash, updates))
+        for u, old, c in updates:
+            colors[u] = c
+            state_hash ^= hash((u, old)) ^ hash((u, c))
+        if history is not None:
+            history.record([u for u, _, _ in updates], [c for _, _, c in updates])
+
+        generation += 1
+        if observer is not None:
+            for _, old, c in updates:
+                if old != UNCOLORED:
+                    counts[old] -= 1
+                counts[c] += 1
+            observer.on_generation(GenerationStats(
+                generation, time.perf_counter() - t0, len(updates), len(frontier), counts[:],
+            ))
+        if generation == max_rounds or not updates:
+            break
+
+        period = next(
+            (back for back in range(2, len(recent) + 1)
+             if recent[-back][0] == state_hash and _reverts(list(recent)[-back:], colors)),
+            0,
+        )
+        if period:
+            if observer is not None:
+                observer.on_cycle(generation, period)
+            if history is not None:
+                history.repeat_last(period, max_rounds)
+            # undo the changes made since the target generation
+            target = _cycle_state(generation, period, max_rounds, max_rounds)
+            for _, changes in list(recent)[len(recent) - (generation - target):][::-1]:
+                for u, old, _ in changes:
+                    colors[u] = old
+            generation = max_rounds
+            break
+
+        touched = set()
+        for u, *_ in updates:
+            touched.add(u)
+            touched.update(neighbors[u])
+        frontier = touched
 
     scores = [0] * T
     for c in colors:
@@ -78,5 +324,172 @@ def simulate(
         final_colors=colors,
         num_generations=generation,
         scores=scores,
-        history=history,
     )
+
+
+def _reverts(generations: List[Tuple[int, List[Tuple[int, int, int]]]], colors: List[int]) -> bool:
+    """True if the changes of these consecutive generations (oldest first) end
+    with every touched node back at the color it had before the first one."""
+    before = {}
+    for _, changes in generations:
+        for u, old, _ in changes:
+            before.setdefault(u, old)
+    return all(colors[u] == c for u, c in before.items())
+
+
+# budget for the per-instance state of a batch (the last _MAX_PERIOD
+# generations for cycle detection plus vote counts, about
+# (T + 4 + _MAX_PERIOD) * n elements per instance)
+_BATCH_STATE_ELEMENTS = 1 << 24
+# cap on (instances x CSR entries) per vote update: the update is memory-bound,
+# so groups stay small enough for their working set to remain in cache;
+# larger graphs update fewer instances at a time, down to one
+_BATCH_GATHER_ELEMENTS = 1 << 18
+
+
+def simulate_batch(
+    G: GraphLike,
+    seed_configs: Union[List[List[List[int]]], np.ndarray],
+    *,
+    rng: Optional[random.Random] = None,
+    caps: Optional[Sequence[int]] = None,
+    scores_only: bool = False,
+    max_batch: Optional[int] = None,
+) -> Union[List[SimulationResult], np.ndarray]:
+    """Simulate many independent matchups on the same graph at once.
+
+    seed_configs[b] is a `seeds_by_team` list for instance b (or a (B, T, k)
+    int array, e.g. every round of a match at once). Caps are drawn
+    from rng in config order, so the results equal
+    `[simulate(G, cfg, rng=rng) for cfg in seed_configs]`. caps, if given,
+    are used instead (one per config, e.g. each round's
+    `round_rng(seed, r).randint(100, 200)`), and rng is not touched.
+
+    The active instances are stacked into a (B x n) color matrix and updated
+    together; the neighbor-vote gather runs over groups of instances so that
+    at most _BATCH_GATHER_ELEMENTS CSR entries are gathered at once. An
+    instance leaves the batch as soon as it converges, hits its cap, or
+    repeats a state from up to _MAX_PERIOD generations back (which jumps
+    to the state the cap lands on, as in `simulate`). Instances are
+    processed in chunks of at most max_batch (by default sized so the
+    (max_batch x n) state fits _BATCH_STATE_ELEMENTS).
+
+    Returns a list of SimulationResult (no history), or with scores_only a
+    (B x T_max) int array of scores (teams beyond an instance's T are 0).
+    """
+    if rng is None:
+        rng = random.Random()
+
+    B = len(seed_configs)
+    num_teams = [len(cfg) for cfg in seed_configs]
+    T = max(num_teams, default=0)
+
+    init = initial_colors_batch(G.n, seed_configs)
+    if caps is None:
+        caps = [rng.randint(100, 200) for _ in range(B)]
+    max_rounds = np.array(caps, dtype=np.int64)
+    if max_rounds.shape != (B,):
+        raise ValueError(f"caps must have one entry per config ({B})")
+
+    indptr, indices = G.csr
+    if max_batch is None:
+        max_batch = max(1, _BATCH_STATE_ELEMENTS // max(1, (T + 4 + _MAX_PERIOD) * G.n))
+
+    final = np.empty_like(init)
+    generations = np.empty(B, dtype=np.int64)
+    for lo in range(0, B, max_batch):
+        hi = min(B, lo + max_batch)
+        final[lo:hi], generations[lo:hi] = _run_batch(G.n, indptr, indices, init[lo:hi], max_rounds[lo:hi], T)
+
+    scores = np.zeros((B, T), dtype=np.int64)
+    if T:
+        colored = final != UNCOLORED
+        keys = np.nonzero(colored)[0] * T + final[colored]
+        scores = np.bincount(keys, minlength=B * T).reshape(B, T)
+    if scores_only:
+        return scores
+
+    return [
+        SimulationResult(
+            final_colors=final[b].tolist(),
+            num_generations=int(generations[b]),
+            scores=scores[b, :num_teams[b]].tolist(),
+        )
+        for b in range(B)
+    ]
+
+
+def _run_batch(
+    n: int,
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    colors: np.ndarray,
+    max_rounds: np.ndarray,
+    T: int,
+):
+    """Advance a (B x n) batch to completion; returns (final colors, generations)."""
+    B = colors.shape[0]
+    final = colors.copy()
+    generations = np.zeros(B, dtype=np.int64)
+    degrees = np.diff(indptr)
+    rows = np.repeat(np.arange(n, dtype=np.int64), degrees)
+    slots = vote_slots(rows, T)
+    cols = indices.astype(np.int64)
+    # instances per vote gather
+    group = max(1, _BATCH_GATHER_ELEMENTS // max(1, cols.shape[0]))
+
+    # rows of `curr` are the instances in `layout`; finished ones stay in the
+    # layout (ignored) until enough have finished to make compacting pay off
+    layout = np.arange(B)
+    alive = np.ones(B, dtype=bool)
+    curr = colors.copy()
+    generation = 1
+    # states (and row hashes) of the last _MAX_PERIOD generations, generation
+    # g in slot g % _MAX_PERIOD; hashes only shortlist rows for the exact check
+    weights = np.random.default_rng(0).integers(1, 2**31, size=n)
+
+    def row_hash(state: np.ndarray) -> np.ndarray:
+        return (state * weights).sum(axis=1)  # int64, exact (wraps)
+
+    recent = np.empty((_MAX_PERIOD,) + curr.shape, dtype=curr.dtype)
+    recent_hash = np.empty((_MAX_PERIOD, B), dtype=np.int64)
+    recent[generation % _MAX_PERIOD] = curr
+    recent_hash[generation % _MAX_PERIOD] = row_hash(curr)
+
+    while layout.size:
+        prev = curr
+        curr = update_colors_batch(prev, slots, cols, degrees, T, group)
+        generation += 1
+
+        # generation >= 2 here, so stability is: cap reached, or unchanged
+        done = alive & ((generation == max_rounds[layout]) | ~(prev != curr).any(axis=1))
+        if done.any():
+            final[layout[done]] = curr[done]
+            generations[layout[done]] = generation
+            alive &= ~done
+
+        # back to the state of `period` generations ago: repeats until the cap
+        h = row_hash(curr)
+        for period in range(2, min(_MAX_PERIOD, generation - 1) + 1):
+            old = (generation - period) % _MAX_PERIOD
+            cand = np.flatnonzero(alive & (recent_hash[old] == h))
+            if cand.size == 0:
+                continue
+            cyc = cand[~(recent[old][cand] != curr[cand]).any(axis=1)]
+            for i in cyc.tolist():
+                cap = int(max_rounds[layout[i]])
+                g = _cycle_state(generation, period, cap, cap)
+                final[layout[i]] = recent[g % _MAX_PERIOD][i]
+                generations[layout[i]] = cap
+            alive[cyc] = False
+        recent[generation % _MAX_PERIOD] = curr
+        recent_hash[generation % _MAX_PERIOD] = h
+
+        if 4 * alive.sum() <= 3 * layout.size:
+            layout = layout[alive]
+            curr = curr[alive]
+            recent = recent[:, alive]
+            recent_hash = recent_hash[:, alive]
+            alive = alive[alive]
+
+    return final, generations
@@ -1,20 +1,27 @@
 import argparse
 import math
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import networkx as nx
+import numpy as np
 
-from core.io import save_graph_json
+from core.graph import CSRGraph
+from core.io import GRAPH_ER, GRAPH_PA, GRAPH_SSBM, graph_cache_dir, save_csr_json, save_graph_json, write_graph_cache
+
+Edges = Tuple[int, np.ndarray, np.ndarray]   # (n, src, dst)
+
+def _default_er_p(n: int) -> float:
+    lo = 1.0 / n
+    hi = math.log(n) / n
+    return (lo + hi) / 2
 
 def gen_ER(n: int, p: Optional[float], seed: int) -> nx.Graph:
     """
     Erdos-Renyi random graph G(n,p).
     """
     if p is None:
-        lo = 1.0 / n
-        hi = math.log(n) / n
-        p = (lo + hi) / 2
+        p = _default_er_p(n)
     return nx.gnp_random_graph(n, p, seed=seed, directed=False)
 
 def gen_PA(n: int, m: int, seed: int) -> nx.Graph:
@@ -38,6 +45,128 @@ def gen_ssbm(n: int, k:int, p_in: float, p_out: float, seed: int) -> nx.Graph:
     probs = [[p_in if i == j else p_out for j in range(k)] for i in range(k)]
     return nx.stochastic_block_model(sizes, probs, seed=seed)
 
+# Native generators: edge arrays straight from numpy (seeded by `seed`), for
+# graphs far beyond what networkx builds in reasonable time and memory. They
+# sample the same models as the networkx ones above, but not the same graphs.
+
+def _triangle_pairs(pos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Linear indices into the pairs (i, j), j < i, ordered by i then j -> (i, j)."""
+    i = np.floor((1 + np.sqrt(1 + 8 * pos.astype(np.float64))) / 2).astype(np.int64)
+    # float rounding can be off by one either way for huge indices
+    i -= i * (i - 1) // 2 > pos
+    i += (i + 1) * i // 2 <= pos
+    return i, pos - i * (i - 1) // 2
+
+def _skip_sample(total: int, p: float, rng: np.random.Generator) -> np.ndarray:
+    """Sorted positions in [0, total) kept independently with probability p,
+    by drawing the geometric gaps between kept positions (Batagelj-Brandes)."""
+    if p <= 0 or total <= 0:
+        return np.zeros(0, dtype=np.int64)
+    mean = total * p
+    chunk = int(mean + 5 * math.sqrt(mean)) + 1024
+    parts = []
+    last = -1
+    while last < total:
+        pos = last + np.cumsum(rng.geometric(p, size=chunk))
+        parts.append(pos)
+        last = int(pos[-1])
+    pos = np.concatenate(parts)
+    return pos[:np.searchsorted(pos, total)]
+
+def er_edges(n: int, p: Optional[float], seed: int) -> Edges:
+    """G(n, p) in O(n + edges) via geometric skips over the n(n-1)/2 pairs."""
+    if p is None:
+        p = _default_er_p(n)
+    rng = np.random.default_rng(seed)
+    src, dst = _triangle_pairs(_skip_sample(n * (n - 1) // 2, p, rng))
+    return n, src, dst
+
+def pa_edges(n: int, m: int, seed: int) -> Edges:
+    """
+    Preferential attachment (Batagelj-Brandes), vectorized.
+
+    Starts from a star on nodes 0..m; every later node v adds m edges whose
+    targets are uniform picks from the endpoint list of all earlier edges, so
+    a node is picked proportionally to its degree. A pick that lands on the
+    target slot of an earlier edge copies that edge's target; those copies
+    are resolved together by pointer jumping. Targets are drawn with
+    replacement, so a repeated pick merges into one edge.
+    """
+    if m < 1 or m >= n:
+        raise ValueError(f"Invalid m={m} for PA graph with n={n}. Must have 1 <= m < n.")
+    rng = np.random.default_rng(seed)
+    # edge e has endpoint slots 2e (source) and 2e + 1 (target);
+    # edges 0..m-1 are the star (0, e + 1)
+    new_src = np.repeat(np.arange(m + 1, n, dtype=np.int64), m)
+    first = m + m * (new_src - m - 1)              # edges that exist before the source's own
+    slot = (rng.random(new_src.shape[0]) * (2 * first)).astype(np.int64)
+
+    picks = slot.copy()
+    while True:
+        copy = (picks & 1).astype(bool) & (picks >> 1 >= m)
+        if not copy.any():
+            break
+        picks[copy] = slot[(picks[copy] >> 1) - m]
+    edge = picks >> 1
+    is_src = (picks & 1) == 0
+    dst = np.where(edge < m, np.where(is_src, 0, edge + 1), 0)
+    later = edge >= m
+    dst[later] = new_src[edge[later] - m]           # only sources are left after jumping
+
+    src = np.concatenate((np.zeros(m, dtype=np.int64), new_src))
+    dst = np.concatenate((np.arange(1, m + 1, dtype=np.int64), dst))
+    return n, src, dst
+
+def ssbm_edges(n: int, k: int, p_in: float, p_out: float, seed: int) -> Edges:
+    """
+    SSBM with k equal blocks, block pair by block pair: the edge count is a
+    binomial draw over the pair's node pairs, then that many distinct pairs
+    are chosen uniformly.
+    """
+    if n % k != 0:
+        raise ValueError(f"n={n} must be divisible by k={k} for equal-sized communities.")
+    rng = np.random.default_rng(seed)
+    size = n // k
+    src_parts, dst_parts = [], []
+    for a in range(k):
+        for b in range(a + 1):
+            total = size * (size - 1) // 2 if a == b else size * size
+            count = int(rng.binomial(total, p_in if a == b else p_out))
+            pos = rng.choice(total, size=count, replace=False)
+            if a == b:
+                i, j = _triangle_pairs(pos)
+            else:
+                i, j = np.divmod(pos, size)
+            src_parts.append(a * size + i)
+            dst_parts.append(b * size + j)
+    return n, np.concatenate(src_parts), np.concatenate(dst_parts)
+
+def gen_native(family: str, n: int, seed: int, *, p: Optional[float] = None, m: int = 1,
+               k_blocks: int = 5, p_in: float = 0.05, p_out: float = 0.005) -> CSRGraph:
+    """CSRGraph from the native generator for 'ER', 'PA' or 'SSBM'."""
+    if family == GRAPH_ER:
+        edges = er_edges(n, p, seed)
+    elif family == GRAPH_PA:
+        edges = pa_edges(n, m, seed)
+    elif family == GRAPH_SSBM:
+        edges = ssbm_edges(n, k_blocks, p_in, p_out, seed)
+    else:
+        raise ValueError(f"Unknown graph family: {family}")
+    return CSRGraph.from_edges(*edges, family=family)
+
+def save_native(G: CSRGraph, out_path: Path, fmt: str = "json") -> None:
+    """
+    Write a generated graph as JSON ("json"), as a binary CSR cache directory
+    only ("csr"), or both ("both": the cache is stamped against the JSON so
+    load_graph picks it up warm).
+    """
+    meta = {"comp": None, "k": None, "family": G.family}
+    if fmt in ("json", "both"):
+        save_csr_json(G.indptr, G.indices, out_path)
+    if fmt in ("csr", "both"):
+        write_graph_cache(graph_cache_dir(out_path), G.indptr, G.indices, meta,
+                          source_path=out_path if fmt == "both" else None)
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Generate test graphs into graphs/gen/*.json")
     parser.add_argument("--type", required=True, choices=["ER", "PA", "SSBM"], help="Graph family to generate.")
@@ -56,25 +185,45 @@ def main() -> None:
     parser.add_argument("--p-in", default=0.05, type=float, help="SSBM intra-block p (default 0.05).")
     parser.add_argument("--p-out", default=0.005, type=float, help="SSBM inter-block p (default 0.005).")
 
+    # output
+    parser.add_argument("--format", default="json", choices=["json", "csr", "both"],
+                        help="json, binary CSR cache directory (<name>.json.csr/), or both (default json).")
+    parser.add_argument("--native", action="store_true",
+                        help="Use the numpy generators (fast, for million-node graphs). They draw different "
+                             "graphs than the default networkx ones for the same seed; files get a _native suffix.")
+
     args = parser.parse_args()
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-
     if args.type == "ER":
-        G = gen_ER(args.n, args.p, args.seed)
         default_name = f"ER_n{args.n}_p{(args.p if args.p is not None else 'auto')}_seed{args.seed}"
     elif args.type == "PA":
-        G = gen_PA(args.n, args.m, args.seed)
         default_name = f"PA_n{args.n}_m{args.m}_seed{args.seed}"
     else:
-        G = gen_ssbm(args.n, args.k_blocks, args.p_in, args.p_out, args.seed)
         default_name = f"SSBM_n{args.n}_k{args.k_blocks}_pin{args.p_in}_pout{args.p_out}_seed{args.seed}"
-
-    
+    if args.native:
+        default_name += "_native"
     out_path = out_dir / f"{default_name}.json"
-    save_graph_json(G, out_path)
-    print(f"Wrote {args.type} graph to {out_path}")
+
+    if not args.native:
+        if args.type == "ER":
+            G_nx = gen_ER(args.n, args.p, args.seed)
+        elif args.type == "PA":
+            G_nx = gen_PA(args.n, args.m, args.seed)
+        else:
+            G_nx = gen_ssbm(args.n, args.k_blocks, args.p_in, args.p_out, args.seed)
+        if args.format == "json":
+            save_graph_json(G_nx, out_path)
+            print(f"Wrote {args.type} graph to {out_path}")
+            return
+        G = CSRGraph.from_networkx(G_nx, family=args.type)
+    else:
+        G = gen_native(args.type, args.n, args.seed, p=args.p, m=args.m,
+                       k_blocks=args.k_blocks, p_in=args.p_in, p_out=args.p_out)
+    save_native(G, out_path, args.format)
+    where = graph_cache_dir(out_path) if args.format == "csr" else out_path
+    print(f"Wrote {args.type} graph ({G.n} nodes, {G.indices.shape[0] // 2} edges) to {where}")
 
 
 if __name__ == "__main__":
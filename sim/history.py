@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+_MAGIC = b"SIMHIST1"
+
+
+class SimulationHistory:
+    """States of a simulation run, stored as deltas.
+
+    Keeps the initial colors plus, per generation, the nodes that changed and
+    their new colors (int32 arrays, sorted by node). history[i] rebuilds the
+    state of generation i + 1 (history[0] is the initial coloring, history[-1]
+    the final one), so a run costs O(n + total changes) instead of O(n) per
+    generation.
+
+    With `path`, changes are streamed to that file as they are recorded and
+    only their offsets stay in memory; `SimulationHistory.load(path)` opens
+    such a file again later.
+
+    File layout: magic, int64 n, int32[n] initial colors, then per
+    generation int64 count, int32[count] nodes, int32[count] colors.
+    """
+
+    def __init__(self, initial: Sequence[int], path: Optional[Union[str, Path]] = None) -> None:
+        self.initial = np.array(initial, dtype=np.int32)
+        self.path = Path(path) if path is not None else None
+        self._changes: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._offsets: List[Tuple[int, int]] = []   # (byte offset, count) per generation, file mode
+        self._file: Optional[BinaryIO] = None
+        # last rebuilt (index, state), so walking forward replays only new changes
+        self._cursor: Optional[Tuple[int, np.ndarray]] = None
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("wb")
+            self._file.write(_MAGIC)
+            self._file.write(np.int64(self.initial.shape[0]).tobytes())
+            self._file.write(self.initial.tobytes())
+            self._end = self._file.tell()
+
+    @property
+    def n(self) -> int:
+        return int(self.initial.shape[0])
+
+    def __len__(self) -> int:
+        """Number of states (the run's num_generations)."""
+        return 1 + len(self._offsets if self.path is not None else self._changes)
+
+    def record(self, nodes, colors) -> None:
+        """Append the next generation: `nodes` took `colors`."""
+        nodes = np.asarray(nodes, dtype=np.int32)
+        colors = np.asarray(colors, dtype=np.int32)
+        if nodes.shape[0] > 1 and np.any(nodes[1:] < nodes[:-1]):
+            order = np.argsort(nodes, kind="stable")
+            nodes, colors = nodes[order], colors[order]
+
+        if self.path is None:
+            self._changes.append((nodes, colors))
+            return
+        count = nodes.shape[0]
+        self._file.write(np.int64(count).tobytes())
+        self._offsets.append((self._end + 8, count))
+        self._file.write(nodes.tobytes())
+        self._file.write(colors.tobytes())
+        self._end += 8 + 8 * count
+
+    def repeat_last(self, period: int, num_states: int) -> None:
+        """Extend a run whose last state equals the one `period` states back:
+        the following generations replay the same changes, up to num_states."""
+        while len(self) < num_states:
+            self.record(*self.changes(len(self) - period))
+
+    def close(self) -> None:
+        """Flush a streamed history; it stays readable."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def changes(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(nodes, colors) that turn state i - 1 into state i (1 <= i < len)."""
+        if not 1 <= i < len(self):
+            raise IndexError(f"no changes into state {i} (history has {len(self)} states)")
+        if self.path is None:
+            return self._changes[i - 1]
+        if self._file is not None:
+            self._file.flush()
+        offset, count = self._offsets[i - 1]
+        if count == 0:
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty
+        data = np.fromfile(self.path, dtype=np.int32, count=2 * count, offset=offset)
+        return data[:count], data[count:]
+
+    def state(self, i: int) -> np.ndarray:
+        """Colors at state i (a fresh array), rebuilt from the nearest earlier state."""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"state {i} out of range (history has {len(self)} states)")
+        if self._cursor is not None and self._cursor[0] <= i:
+            j, s = self._cursor[0], self._cursor[1].copy()
+        else:
+            j, s = 0, self.initial.copy()
+        for g in range(j + 1, i + 1):
+            nodes, colors = self.changes(g)
+            s[nodes] = colors
+        self._cursor = (i, s.copy())
+        return s
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self.state(i)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        """Every state in order, each a fresh array; O(changes) per step."""
+        s = self.initial.copy()
+        yield s.copy()
+        for g in range(1, len(self)):
+            nodes, colors = self.changes(g)
+            s[nodes] = colors
+            yield s.copy()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SimulationHistory):
+            return NotImplemented
+        if len(self) != len(other) or not np.array_equal(self.initial, other.initial):
+            return False
+        return all(
+            np.array_equal(a, b)
+            for g in range(1, len(self))
+            for a, b in zip(self.changes(g), other.changes(g))
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SimulationHistory":
+        """Open a history streamed to `path`."""
+        path = Path(path)
+        with path.open("rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path}: not a simulation history file")
+            n = int(np.frombuffer(f.read(8), dtype=np.int64)[0])
+            initial = np.frombuffer(f.read(4 * n), dtype=np.int32)
+            offsets = []
+            pos = len(_MAGIC) + 8 + 4 * n
+            size = path.stat().st_size
+            while pos < size:
+                f.seek(pos)
+                count = int(np.frombuffer(f.read(8), dtype=np.int64)[0])
+                offsets.append((pos + 8, count))
+                pos += 8 + 8 * count
+
+        h = cls.__new__(cls)
+        h.initial = initial.copy()
+        h.path = path
+        h._changes = []
+        h._offsets = offsets
+        h._file = None
+        h._cursor = None
+        h._end = pos
+        return h
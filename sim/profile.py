@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import csv
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class GenerationStats:
+    generation: int          # generation produced by this update (2, 3, ...)
+    seconds: float           # wall time of the update
+    changed: int             # nodes whose color changed
+    evaluated: int           # nodes the engine re-evaluated (frontier size)
+    team_counts: List[int]   # nodes owned per team after the update
+
+
+class SimulationObserver:
+    """Hooks called by `simulate` when an observer is passed.
+
+    Engines only build GenerationStats when an observer is present, so
+    simulations without one pay nothing. Override the hooks you need.
+    """
+
+    def on_start(self, engine: str, n: int, num_teams: int, max_rounds: int, team_counts: List[int]) -> None:
+        pass
+
+    def on_generation(self, stats: GenerationStats) -> None:
+        pass
+
+    def on_cycle(self, generation: int, period: int) -> None:
+        """The state at `generation` repeats the one `period` generations back;
+        the engine skips ahead to the cap."""
+        pass
+
+    def on_end(self, num_generations: int, scores: List[int]) -> None:
+        pass
+
+
+@dataclass
+class SimulationProfile(SimulationObserver):
+    """Observer that records everything, for dumping as a trace."""
+    engine: str = ""
+    n: int = 0
+    num_teams: int = 0
+    max_rounds: int = 0
+    initial_counts: List[int] = field(default_factory=list)
+    generations: List[GenerationStats] = field(default_factory=list)
+    cycle: Optional[Tuple[int, int]] = None   # (generation, period) if a cycle was skipped
+    num_generations: int = 0
+    scores: List[int] = field(default_factory=list)
+    seconds: float = 0.0                      # whole simulation, including setup
+    _t0: float = field(default=0.0, repr=False)
+
+    def on_start(self, engine: str, n: int, num_teams: int, max_rounds: int, team_counts: List[int]) -> None:
+        self._t0 = time.perf_counter()
+        self.engine, self.n, self.num_teams, self.max_rounds = engine, n, num_teams, max_rounds
+        self.initial_counts = list(team_counts)
+
+    def on_generation(self, stats: GenerationStats) -> None:
+        self.generations.append(stats)
+
+    def on_cycle(self, generation: int, period: int) -> None:
+        self.cycle = (generation, period)
+
+    def on_end(self, num_generations: int, scores: List[int]) -> None:
+        self.seconds = time.perf_counter() - self._t0
+        self.num_generations = num_generations
+        self.scores = list(scores)
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = asdict(self)
+        d.pop("_t0")
+        return d
+
+
+def write_trace(path: str, profiles: Sequence[SimulationProfile]) -> None:
+    """Dump one profile per round: CSV (one row per generation) if path ends
+    in .csv, JSON otherwise."""
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    if p.suffix.lower() != ".csv":
+        with p.open("w", encoding="utf-8") as f:
+            json.dump([dict(round=r, **prof.to_dict()) for r, prof in enumerate(profiles)], f, indent=1)
+        return
+
+    T = max((prof.num_teams for prof in profiles), default=0)
+    with p.open("w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["round", "generation", "seconds", "changed", "evaluated"] + [f"team{t}" for t in range(T)])
+        for r, prof in enumerate(profiles):
+            for g in prof.generations:
+                counts = g.team_counts + [0] * (T - len(g.team_counts))
+                w.writerow([r, g.generation, f"{g.seconds:.6f}", g.changed, g.evaluated] + counts)
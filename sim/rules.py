@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections import Counter
 from typing import List, Tuple
 
+import numpy as np
+
 
 UNCOLORED = -1
 
@@ -39,6 +41,91 @@ def update_node(
     return False, curr
 
 
+def vote_slots(rows: np.ndarray, num_teams: int) -> np.ndarray:
+    """Per-CSR-entry base offsets for `update_colors_csr`: rows * (T + 1).
+
+    rows[e] is the source node of CSR entry e (the expanded indptr). Computed
+    once per simulation since it only depends on the graph and T.
+    """
+    dtype = np.int32 if (int(rows.max(initial=0)) + 1) * (num_teams + 1) < 2**31 else np.int64
+    return rows.astype(dtype) * dtype(num_teams + 1)
+
+
+def update_colors_csr(
+    prev_colors: np.ndarray,
+    slots: np.ndarray,
+    indices: np.ndarray,
+    degrees: np.ndarray,
+    num_teams: int,
+) -> np.ndarray:
+    """Vectorized `update_node` over all nodes at once.
+
+    slots = vote_slots(rows, T) and indices[e] is the target of CSR entry e.
+    One bincount over (slot + neighbor color + 1) yields, per node, the
+    uncolored-neighbor count and the per-team counts. The 1.5 self-vote and
+    the (# colored neighbors) / 2 threshold are applied in doubled integer
+    units (2 * votes + 3 > colored) so the result is exact.
+
+    A passing top color is always unique (self-vote is half-integral, neighbor
+    votes are integral), so tie-breaking never differs from Counter.most_common.
+    """
+    n = prev_colors.shape[0]
+    if num_teams == 0 or n == 0:
+        return prev_colors.copy()
+
+    counts = np.bincount(slots + (prev_colors[indices] + 1), minlength=n * (num_teams + 1))
+    return _majority(prev_colors, counts.reshape(n, num_teams + 1), degrees, num_teams)
+
+
+def update_colors_batch(
+    prev_colors: np.ndarray,
+    slots: np.ndarray,
+    indices: np.ndarray,
+    degrees: np.ndarray,
+    num_teams: int,
+    group: int,
+) -> np.ndarray:
+    """`update_colors_csr` for a (B x n) batch of instances on one graph.
+
+    Instances are updated `group` at a time (one bincount each), so the
+    temporary (instances x CSR entries) arrays stay bounded on large graphs.
+    """
+    B, n = prev_colors.shape
+    if num_teams == 0 or n == 0:
+        return prev_colors.copy()
+
+    width = n * (num_teams + 1)
+    group = max(1, min(B, group))
+    dtype = np.int32 if group * width < 2**31 else np.int64
+    slots = slots.astype(dtype, copy=False)
+    group_degrees = np.tile(degrees, group)
+    out = np.empty_like(prev_colors)
+    for lo in range(0, B, group):
+        hi = min(B, lo + group)
+        base = (np.arange(hi - lo, dtype=dtype) * dtype(width))[:, None]
+        keys = base + slots[None, :] + (prev_colors[lo:hi][:, indices] + 1)
+        counts = np.bincount(keys.ravel(), minlength=(hi - lo) * width).reshape(-1, num_teams + 1)
+        out[lo:hi] = _majority(
+            prev_colors[lo:hi].ravel(), counts, group_degrees[:(hi - lo) * n], num_teams
+        ).reshape(hi - lo, n)
+    return out
+
+
+def _majority(self_colors: np.ndarray, counts: np.ndarray, degrees: np.ndarray, num_teams: int) -> np.ndarray:
+    """Next colors from per-node vote counts (column 0: uncolored neighbors)."""
+    # a team must beat the number of colored neighbors (doubled threshold);
+    # after a team passes, others must beat its votes instead
+    best = self_colors.copy()
+    best_votes = degrees - counts[:, 0]
+    for t in range(num_teams):
+        votes = 2 * counts[:, t + 1]
+        votes[self_colors == t] += 3
+        win = votes > best_votes
+        best[win] = t
+        best_votes[win] = votes[win]
+    return best
+
+
 def apply_seed_conflicts(seeds_by_team: List[List[int]]) -> List[List[int]]:
     """Resolve seed conflicts: if multiple teams pick the same node, nobody gets it.
 
@@ -52,3 +139,54 @@ def apply_seed_conflicts(seeds_by_team: List[List[int]]) -> List[List[int]]:
     for seeds in seeds_by_team:
         filtered.append([int(s) for s in seeds if counts[int(s)] == 1])
     return filtered
+
+
+def flatten_seeds(seed_configs) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(config, team, node) int64 arrays for every seed of every config.
+
+    seed_configs[b][t] is team t's seed list in config b. A (B, T, k) int
+    array is flattened without a Python loop; ragged lists are walked once.
+    """
+    if isinstance(seed_configs, np.ndarray):
+        B, T, k = seed_configs.shape
+        config = np.repeat(np.arange(B, dtype=np.int64), T * k)
+        team = np.tile(np.repeat(np.arange(T, dtype=np.int64), k), B)
+        return config, team, seed_configs.astype(np.int64).ravel()
+
+    config, team, nodes = [], [], []
+    for b, cfg in enumerate(seed_configs):
+        for t, seeds in enumerate(cfg):
+            nodes.extend(seeds)
+            config.extend([b] * len(seeds))
+            team.extend([t] * len(seeds))
+    return (np.asarray(config, dtype=np.int64), np.asarray(team, dtype=np.int64),
+            np.asarray(nodes, dtype=np.int64))
+
+
+def initial_colors_batch(n: int, seed_configs) -> np.ndarray:
+    """(B, n) int32 generation-1 colors, one row per seeds_by_team config.
+
+    Same rule as `apply_seed_conflicts` (a node listed more than once in a
+    config, by any teams, goes to nobody), resolved for all configs in one
+    np.unique pass over (config, node) keys.
+    """
+    B = seed_configs.shape[0] if isinstance(seed_configs, np.ndarray) else len(seed_configs)
+    colors = np.full((B, n), UNCOLORED, dtype=np.int32)
+    config, team, nodes = flatten_seeds(seed_configs)
+    if nodes.size == 0:
+        return colors
+    if int(nodes.min()) < 0 or int(nodes.max()) >= n:
+        bad = nodes[(nodes < 0) | (nodes >= n)][0]
+        raise ValueError(f"Seed out of range: {bad} (n={n})")
+    keys = config * n + nodes
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    keep = counts[inverse] == 1
+    colors.ravel()[keys[keep]] = team[keep]
+    return colors
+
+
+def initial_colors(n: int, seeds_by_team) -> np.ndarray:
+    """Generation-1 colors (int32, length n) for one match, conflicts resolved."""
+    if isinstance(seeds_by_team, np.ndarray):
+        return initial_colors_batch(n, seeds_by_team[None])[0]
+    return initial_colors_batch(n, [seeds_by_team])[0]
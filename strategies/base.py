@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 import random
 
-from core.graph import Graph
+from core.graph import GraphLike
 
 
 @dataclass
@@ -19,9 +19,9 @@ class Strategy:
 
     name: str = "strategy"
 
-    def select_seeds(self, G: Graph, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
+    def select_seeds(self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
         raise NotImplementedError
 
-    def select_seeds_50(self, G: Graph, k: int, rng: random.Random, ctx: StrategyContext, rounds: int = 50) -> List[List[int]]:
+    def select_seeds_50(self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext, rounds: int = 50) -> List[List[int]]:
         """Select seeds for multiple rounds."""
         return [self.select_seeds(G, k, rng, ctx) for _ in range(rounds)]
@@ -3,12 +3,14 @@ from __future__ import annotations
 from typing import List, Set, FrozenSet
 import random
 
-from core.graph import Graph
+from core.graph import GraphLike
 from strategies.base import Strategy, StrategyContext
 from strategies.cluster import (
     ClusterBoundaryTakeoverSpectral,
     ClusterTopDegreeProportionalSpectral,
 )
+from strategies.greedy import SimulatedGreedy
+from strategies.refine import LocalSwapRefiner
 
 def get_strategy(name: str, **kwargs) -> Strategy:
     name = name.strip().lower()
@@ -22,12 +24,16 @@ def get_strategy(name: str, **kwargs) -> Strategy:
         return ClusterBoundaryTakeoverSpectral(**kwargs)
     if name in {"cluster_top_degree_proportional_spectral", "degree_cluster"}:
         return ClusterTopDegreeProportionalSpectral(**kwargs)
+    if name in {"simulated_greedy", "greedy"}:
+        return SimulatedGreedy(**kwargs)
+    if name in {"local_swap"}:
+        return LocalSwapRefiner(**kwargs)
     raise ValueError(f"Unknown strategy: {name}")
 
 class RandomK(Strategy):
     name = "random_k"
 
-    def select_seeds(self, G: Graph, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
+    def select_seeds(self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
         if k > G.n:
             print(f"Warning: k={k} > n={G.n}, have repeat seeds.")
             return [rng.randint(0, G.n - 1) for _ in range(k)]
@@ -43,13 +49,12 @@ class TopDegreeRandomTie(Strategy):
     def __init__(self, top_m):
         self.top_m = top_m
 
-    def select_seeds(self, G: Graph, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
+    def select_seeds(self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
         if k > G.n:
             raise ValueError(f"k={k} > n={G.n}")
         m = min(G.n, max(k, int(self.top_m * k)))
-        # indices of nodes sorted by degree desc
-        nodes_sorted = sorted(range(G.n), key=lambda u: G.degrees[u], reverse=True)
-        pool = nodes_sorted[:m]
+        # top-m nodes by degree desc, from the graph's cached degree order
+        pool = G.top_degree(m)
         if k > len(pool):
             return pool[:]  # fallback
         return rng.sample(pool, k)
@@ -64,13 +69,12 @@ class TopDegreeAvoid(Strategy):
         # top_m >= 2
         self.top_m = top_m
 
-    def select_seeds(self, G: Graph, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
+    def select_seeds(self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
         if k > G.n:
             raise ValueError(f"k={k} > n={G.n}")
         m = min(G.n, max(k, int(self.top_m * k)))
-        # indices of nodes sorted by degree desc
-        nodes_sorted = sorted(range(G.n), key=lambda u: G.degrees[u], reverse=True)
-        pool = nodes_sorted[k:m]
+        # nodes ranked k..m-1 by degree desc, from the graph's cached degree order
+        pool = G.top_degree(m)[k:]
         if k > len(pool):
             return pool[:]  # fallback
         return rng.sample(pool, k)
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from typing import Dict, List, Set, FrozenSet, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, FrozenSet, Tuple
 import random
+import warnings
 import numpy as np
 
-from core.graph import Graph
+try:
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import connected_components
+    from scipy.sparse.linalg import lobpcg
+except ImportError:  # scipy is optional: dense eigensolver only
+    sp = None
+
+from core.graph import GraphLike
 from strategies.base import Strategy, StrategyContext
 
 from typing import List, Set, FrozenSet
@@ -16,7 +24,7 @@ from typing import List, Set, FrozenSet
 
 def _select_seeds_50_unique(
     strategy: Strategy,
-    G: Graph,
+    G: GraphLike,
     k: int,
     rng: random.Random,
     ctx: StrategyContext,
@@ -41,9 +49,32 @@ def _select_seeds_50_unique(
             out.append(strategy.select_seeds(G, k, rng, ctx))
     return out
 
-def _spectral_clusters_sorted_fiedler(
-    G: Graph,
-    rng: random.Random,
+def _memoized(G: GraphLike, key: Tuple, compute: Callable[[], Any]) -> Any:
+    """Compute once per (graph, key); cached on G.memo."""
+    memo = G.memo
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
+
+def _shuffled_order(size: int, rng: random.Random) -> List[int]:
+    # randomize cluster order slightly (helps tie-breaking stability);
+    # draws the same random numbers as shuffling the cluster list itself
+    order = list(range(size))
+    rng.shuffle(order)
+    return order
+
+def _spectral_clusters(
+    G: GraphLike,
+    min_cluster_size: int = 20,
+    max_clusters: int = 50,
+    normalized: bool = True,
+) -> List[List[int]]:
+    """Memoized per graph and parameters: the bisection does not depend on rng."""
+    key = ("spectral_clusters", min_cluster_size, max_clusters, normalized)
+    return _memoized(G, key, lambda: _compute_spectral_clusters(G, min_cluster_size, max_clusters, normalized))
+
+def _compute_spectral_clusters(
+    G: GraphLike,
     min_cluster_size: int = 20,
     max_clusters: int = 50,
     normalized: bool = True,
@@ -53,35 +84,27 @@ def _spectral_clusters_sorted_fiedler(
       - Build Laplacian (normalized by default)
       - Take Fiedler vector (2nd smallest eigenvector)
       - Sort nodes by that vector
-      - Sweep cut to minimize conductance
+      - Sweep cut to minimize conductance (over the full ordering)
       - Recurse on both sides until stopping criteria
 
+    A disconnected cluster is first split into its largest connected
+    component and the rest (a zero-conductance cut) when both are big
+    enough; otherwise the small components ride along on the right side of
+    the largest one's cut. Eigenvectors are only ever computed for
+    connected subgraphs.
+
+    Clusters larger than _DENSE_MAX_NODES use a scipy.sparse Laplacian and
+    LOBPCG (warm-started from the parent's Fiedler vector) when scipy is
+    available; smaller ones use the dense eigh path.
+
     Returns: list of clusters (each is a list of node ids in original graph).
     """
-    neighbors = G.neighbors
-    degrees = G.degrees
-
-    # includes nodes in nodes and all edges from original graph whose endpoints are both in S
-    def induced_subgraph(nodes: List[int]) -> Tuple[np.ndarray, np.ndarray, List[int]]:
-        """Return (A, deg, nodes) for the induced subgraph on 'nodes'."""
-        idx = {u: i for i, u in enumerate(nodes)} # dictionary {nodes: idx}
-        n2 = len(nodes)
-        A = np.zeros((n2, n2), dtype=np.float64)
-        deg = np.zeros(n2, dtype=np.float64)
-        for i, u in enumerate(nodes):
-            for v in neighbors[u]:
-                j = idx.get(v)
-                if j is not None:
-                    A[i, j] = 1.0
-            deg[i] = A[i].sum()
-        return A, deg, nodes
-
     # Given an induced subgraph’s adjacency matrix A and its degree vector deg
-    # returns order of nodes based on the Fiedler vector
-    def fiedler_order(A: np.ndarray, deg: np.ndarray) -> np.ndarray:
+    # returns the Fiedler vector (None if there is no informative one)
+    def fiedler_vector(A: np.ndarray, deg: np.ndarray) -> Optional[np.ndarray]:
         n2 = A.shape[0]
         if n2 <= 2:
-            return np.arange(n2)
+            return None
 
         if normalized:
             # L_sym = I - D^{-1/2} A D^{-1/2}
@@ -103,95 +126,213 @@ def _spectral_clusters_sorted_fiedler(
         idx_nonzero = np.where(w > eps)[0]
         if len(idx_nonzero) == 0:
             # fully disconnected; arbitrary order
-            return np.arange(n2)
-        vec = V[:, idx_nonzero[0]]  # lowest nonzero
-        return np.argsort(vec)
-
-    def best_sweep_cut(nodes: List[int], order_local: np.ndarray) -> int:
-        """
-        Given local node ordering, pick cut index t minimizing conductance over prefix S_t.
-        Returns t in [1, n-1].
-        """
-        n2 = len(nodes)
-        if n2 <= 2:
-            return 1
-
-        local_of: Dict[int, int] = {u: i for i, u in enumerate(nodes)}
-        inS = np.zeros(n2, dtype=bool)
-        volS = 0
-        total_vol = 0
-        for u in nodes:
-            total_vol += degrees[u]
-
-        cut = 0
-        best_phi = float("inf")
-        best_t = 1
-
-        # We update cut incrementally as we add one node at a time.
-        for t in range(1, n2):
-            u_local = int(order_local[t - 1])
-            u = nodes[u_local]
-            inS[u_local] = True
-            volS += degrees[u]
-
-            for v in neighbors[u]:
-                j = local_of.get(v)
-                if j is None:
-                    continue
-                if inS[j]:
-                    cut -= 1
-                else:
-                    cut += 1
-
-            volT = total_vol - volS
-            denom = min(volS, volT)
-            if denom <= 0:
-                continue
-            phi = cut / denom
-            if phi < best_phi:
-                best_phi = phi
-                best_t = t
-            else:
-                return best_t
-
-        return best_t
-
-    # recursive splitting
-    clusters: List[List[int]] = [list(range(G.n))]
+            return None
+        i = idx_nonzero[0]
+        if i + 1 < n2 and w[i + 1] - w[i] < _DEGENERATE_GAP:
+            # repeated eigenvalue: the eigenvector is not unique
+            return None
+        return V[:, i]  # lowest nonzero
+
+    # recursive splitting; each pending cluster carries its parent's Fiedler
+    # vector restricted to its nodes, used to warm-start the sparse solver
+    clusters: List[Tuple[np.ndarray, Optional[np.ndarray]]] = [(np.arange(G.n), None)]
     out: List[List[int]] = []
 
     while clusters and len(out) + len(clusters) < max_clusters:
-        clusters.sort(key=len, reverse=True)
-        nodes = clusters.pop(0)
+        clusters.sort(key=lambda c: len(c[0]), reverse=True)
+        nodes, warm = clusters.pop(0)
 
         if len(nodes) < 2 * min_cluster_size:
-            out.append(nodes)
+            out.append(nodes.tolist())
             continue
 
-        A, deg_local, nodes_ref = induced_subgraph(nodes)
-        order_local = fiedler_order(A, deg_local)
-        t = best_sweep_cut(nodes_ref, order_local)
-
-        left_local = set(order_local[:t].tolist())
-        left = [nodes_ref[i] for i in left_local]
-        right = [nodes_ref[i] for i in range(len(nodes_ref)) if i not in left_local]
+        giant, rest = _split_largest_component(G, nodes)
+        if len(giant) < min_cluster_size:
+            # only small fragments: no split yields a cluster
+            out.append(nodes.tolist())
+            continue
 
-        if len(left) < min_cluster_size or len(right) < min_cluster_size:
-            out.append(nodes)
+        vec = None
+        if len(rest) >= min_cluster_size:
+            left_idx, right_idx = giant, rest
+        else:
+            sub_nodes = nodes[giant]
+            sub_warm = None if warm is None else warm[giant]
+            if sp is not None and len(sub_nodes) > _DENSE_MAX_NODES:
+                sub_vec = _fiedler_vector_sparse(_induced_csr(G, sub_nodes), normalized, sub_warm)
+            else:
+                A = _induced_dense(G, sub_nodes)
+                sub_vec = fiedler_vector(A, A.sum(axis=1))
+            if sub_vec is None:
+                order_local = np.arange(len(giant))
+            else:
+                order_local = np.argsort(_canonical(sub_vec), kind="stable")
+                vec = np.zeros(len(nodes))
+                vec[giant] = sub_vec
+            t = _best_sweep_cut(G, sub_nodes, order_local)
+            left_idx = np.sort(giant[order_local[:t]])
+            right_idx = np.sort(np.concatenate([giant[order_local[t:]], rest]))
+
+        if len(left_idx) < min_cluster_size or len(right_idx) < min_cluster_size:
+            out.append(nodes.tolist())
             continue
 
-        clusters.append(left)
-        clusters.append(right)
+        clusters.append((nodes[left_idx], None if vec is None else vec[left_idx]))
+        clusters.append((nodes[right_idx], None if vec is None else vec[right_idx]))
 
         if len(out) + len(clusters) >= max_clusters:
             break
 
-    out.extend(clusters)
-
-    # randomize cluster order slightly (helps tie-breaking stability)
-    rng.shuffle(out)
+    out.extend(nodes.tolist() for nodes, _ in clusters)
     return out
 
+def _split_largest_component(G: GraphLike, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(largest connected component, all other nodes) of the subgraph induced
+    by 'nodes', as sorted local indices. Ties go to the component holding the
+    earliest node."""
+    n2 = len(nodes)
+    rows, cols = _induced_entries(G, nodes)
+    if sp is not None:
+        A = sp.csr_matrix((np.ones(rows.shape[0]), (rows, cols)), shape=(n2, n2))
+        _, labels = connected_components(A, directed=False)
+    else:
+        # min-label propagation with pointer jumping
+        labels = np.arange(n2)
+        while True:
+            new = labels.copy()
+            np.minimum.at(new, rows, labels[cols])
+            new = new[new]
+            if np.array_equal(new, labels):
+                break
+            labels = new
+    # both label schemes number components in order of their earliest node
+    _, labels = np.unique(labels, return_inverse=True)
+    in_giant = labels == int(np.argmax(np.bincount(labels, minlength=1)))
+    return np.flatnonzero(in_giant), np.flatnonzero(~in_giant)
+
+def _canonical(vec: np.ndarray) -> np.ndarray:
+    """Fiedler vector with solver noise removed, so both eigensolvers sort alike.
+
+    Entries that are zero up to rounding are set to exactly 0 (kept in node
+    order by a stable sort), and the sign is fixed so the largest-magnitude
+    entry is positive.
+    """
+    vec = np.where(np.abs(vec) < 1e-8, 0.0, vec)
+    top = int(np.argmax(np.abs(vec)))
+    return -vec if vec[top] < 0 else vec
+
+# clusters up to this size use the dense eigensolver (also used without scipy)
+_DENSE_MAX_NODES = 256
+
+# eigenvalues closer than this count as repeated; the Fiedler vector of a
+# repeated eigenvalue is any vector of its eigenspace, so both paths skip it
+_DEGENERATE_GAP = 1e-6
+
+def _induced_entries(G: GraphLike, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(rows, cols) in local indices of every CSR entry between two of 'nodes'.
+
+    Rows come out grouped in the order of 'nodes', each in CSR order.
+    """
+    indptr, indices = G.csr
+    nodes_arr = np.asarray(nodes, dtype=np.int64)
+    n2 = nodes_arr.shape[0]
+    local = np.full(G.n, -1, dtype=np.int64)
+    local[nodes_arr] = np.arange(n2)
+
+    starts = indptr[nodes_arr].astype(np.int64)
+    counts = indptr[nodes_arr + 1] - starts
+    rows = np.repeat(np.arange(n2), counts)
+    # positions of every row entry: starts[row] + offset within the row
+    offsets = np.arange(rows.shape[0]) - np.repeat(np.cumsum(counts) - counts, counts)
+    cols = local[indices[np.repeat(starts, counts) + offsets]]
+    keep = cols >= 0
+    return rows[keep], cols[keep]
+
+def _induced_dense(G: GraphLike, nodes: np.ndarray) -> np.ndarray:
+    """Dense 0/1 adjacency of the subgraph induced by 'nodes', in their order."""
+    n2 = len(nodes)
+    A = np.zeros((n2, n2), dtype=np.float64)
+    rows, cols = _induced_entries(G, nodes)
+    A[rows, cols] = 1.0
+    return A
+
+def _induced_csr(G: GraphLike, nodes: np.ndarray):
+    """Sparse (scipy CSR) adjacency of the subgraph induced by 'nodes', in their order."""
+    n2 = len(nodes)
+    rows, cols = _induced_entries(G, nodes)
+    data = np.ones(rows.shape[0], dtype=np.float64)
+    return sp.csr_matrix((data, (rows, cols)), shape=(n2, n2))
+
+def _best_sweep_cut(G: GraphLike, nodes: np.ndarray, order_local: np.ndarray) -> int:
+    """
+    Given local node ordering, pick cut index t minimizing conductance over prefix S_t
+    (the first such t on ties). Returns t in [1, n-1].
+
+    Volumes use degrees in G; the cut counts edges inside 'nodes'. Adding
+    the node at position p turns each of its induced entries into a cut edge
+    (+1) if the other end comes later, and removes one (-1) otherwise, so all
+    prefix cuts are one bincount and a cumsum.
+    """
+    n2 = len(nodes)
+    if n2 <= 2:
+        return 1
+
+    indptr, _ = G.csr
+    nodes_arr = np.asarray(nodes, dtype=np.int64)
+    rank = np.empty(n2, dtype=np.int64)
+    rank[order_local] = np.arange(n2)
+
+    rows, cols = _induced_entries(G, nodes_arr)
+    sign = np.where(rank[cols] > rank[rows], 1, -1)
+    cut = np.cumsum(np.bincount(rank[rows], weights=sign, minlength=n2))[:-1]
+
+    deg = (indptr[nodes_arr + 1] - indptr[nodes_arr]).astype(np.int64)
+    vol = np.cumsum(deg[order_local])
+    vol_s = vol[:-1]
+    denom = np.minimum(vol_s, vol[-1] - vol_s)
+    phi = np.full(n2 - 1, np.inf)
+    ok = denom > 0
+    phi[ok] = cut[ok] / denom[ok]
+    return int(np.argmin(phi)) + 1
+
+def _fiedler_vector_sparse(A, normalized: bool, x0: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """
+    Lowest nonzero-eigenvalue eigenvector of the (normalized) Laplacian of the
+    sparse adjacency A of a connected graph, via LOBPCG.
+
+    The Laplacian's null space is the single vector D^{1/2} 1 (normalized) or
+    1 (unnormalized), so it is passed as the constraint and LOBPCG converges
+    to the same vector the dense path selects with its "w > eps" rule. x0 (e.g. the parent cluster's Fiedler
+    vector restricted to these nodes) warm-starts the iteration.
+    Returns None when the lowest nonzero eigenvalue is repeated (as the
+    dense path does).
+    """
+    n2 = A.shape[0]
+    deg = np.asarray(A.sum(axis=1)).ravel()
+    if normalized:
+        with np.errstate(divide="ignore"):
+            inv_sqrt = np.where(deg > 0, 1.0 / np.sqrt(deg), 0.0)
+        D_inv_sqrt = sp.diags(inv_sqrt)
+        L = sp.identity(n2, format="csr") - D_inv_sqrt @ A @ D_inv_sqrt
+        weight = np.sqrt(deg)
+    else:
+        L = sp.diags(deg) - A
+        weight = np.ones(n2)
+
+    null = (weight / np.linalg.norm(weight))[:, None]
+
+    rs = np.random.default_rng(0)
+    X = rs.standard_normal((n2, 3))
+    if x0 is not None and x0.shape[0] == n2:
+        X[:, 0] = x0
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        w, V = lobpcg(L.tocsr(), X, Y=null, largest=False, tol=1e-8, maxiter=500)
+    order = np.argsort(w)
+    if w[order[1]] - w[order[0]] < _DEGENERATE_GAP:
+        return None
+    return V[:, order[0]]
+
 def _allocate_budget_proportional(sizes: List[int], k: int) -> List[int]:
     total = sum(sizes)
     if total <= 0:
@@ -220,6 +361,103 @@ def _allocate_budget_proportional(sizes: List[int], k: int) -> List[int]:
     return alloc
 
 
+def _group_blocks(nodes_sorted: List[int], score: Callable[[int], Any]) -> List[List[int]]:
+    """Split an already sorted node list into runs of equal score."""
+    blocks: List[List[int]] = []
+    for u in nodes_sorted:
+        if blocks and score(blocks[-1][0]) == score(u):
+            blocks[-1].append(u)
+        else:
+            blocks.append([u])
+    return blocks
+
+def _boundary_blocks(G: GraphLike, cluster: List[int]) -> List[List[int]]:
+    cset = set(cluster) # for fast access
+
+    out_deg: Dict[int, int] = {}
+    for u in cluster:
+        out_deg[u] = sum(1 for v in G.neighbors[u] if v not in cset)
+
+    scored = sorted(cluster, key=lambda u: (out_deg[u], G.degrees[u]), reverse=True)
+    return _group_blocks(scored, out_deg.__getitem__)
+
+def _degree_blocks(G: GraphLike, clusters: List[List[int]]) -> List[List[List[int]]]:
+    """Per cluster: its nodes by degree descending (ties by id), grouped by degree.
+
+    One pass over the cached G.degree_order / G.degree_block_starts: each
+    global degree block is split by cluster, so no per-cluster sort is needed.
+    """
+    label = np.full(G.n, -1, dtype=np.int64)
+    for c, cluster in enumerate(clusters):
+        label[np.asarray(cluster, dtype=np.int64)] = c
+
+    order = G.degree_order
+    starts = G.degree_block_starts
+    block = np.repeat(np.arange(starts.shape[0] - 1), np.diff(starts))
+    lab = label[order]
+    keep = np.flatnonzero(lab >= 0)
+    # stable on the cluster label: degree order is kept within each cluster
+    keep = keep[np.argsort(lab[keep], kind="stable")]
+    nodes, lab, block = order[keep], lab[keep], block[keep]
+
+    out: List[List[List[int]]] = [[] for _ in clusters]
+    if nodes.size == 0:
+        return out
+    cuts = np.flatnonzero((lab[1:] != lab[:-1]) | (block[1:] != block[:-1])) + 1
+    for run, c in zip(np.split(nodes, cuts), lab[np.concatenate(([0], cuts))]):
+        out[int(c)].append(run.tolist())
+    return out
+
+def _pick_by_cluster(
+    G: GraphLike,
+    clusters: List[List[int]],
+    blocks: List[List[List[int]]],
+    k: int,
+    rng: random.Random,
+    tie_shuffle: bool,
+) -> List[int]:
+    """
+    Per-round part of the cluster strategies: shuffle cluster order, allocate
+    seeds proportional to cluster size, then take each cluster's precomputed
+    score blocks in order (shuffling ties), largest cluster first.
+    """
+    order = _shuffled_order(len(clusters), rng)
+    sizes = [len(clusters[c]) for c in order]
+    # alloc[i] tells you how many seeds to pick from clusters[order[i]].
+    alloc = _allocate_budget_proportional(sizes, k)
+
+    used: Set[int] = set()
+    seeds: List[int] = []
+
+    for c, a in sorted(zip(order, alloc), key=lambda x: len(clusters[x[0]]), reverse=True):
+        picked = 0
+        for tie_block in blocks[c]:
+            if picked >= a:
+                break
+            block = [u for u in tie_block if u not in used]
+            if tie_shuffle:
+                rng.shuffle(block)
+            for u in block:
+                if picked >= a:
+                    break
+                seeds.append(u)
+                used.add(u)
+                picked += 1
+
+    # fallback fill by degree if needed (select nodes with highest degree)
+    if len(seeds) < k:
+        # walk the cached degree order; stops after len(used) + k nodes at most
+        for u in G.degree_order:
+            if len(seeds) >= k:
+                break
+            u = int(u)
+            if u not in used:
+                seeds.append(u)
+                used.add(u)
+
+    return seeds[:k]
+
+
 # Method 1: boundary takeover
 
 class ClusterBoundaryTakeoverSpectral(Strategy):
@@ -245,70 +483,22 @@ class ClusterBoundaryTakeoverSpectral(Strategy):
         self.per_cluster_tie_shuffle = per_cluster_tie_shuffle
 
     def select_seeds_50(
-        self, G: Graph, k: int, rng: random.Random, ctx: StrategyContext, rounds: int = 50
+        self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext, rounds: int = 50
     ) -> List[List[int]]:
         return _select_seeds_50_unique(self, G, k, rng, ctx, rounds=rounds, max_attempts=10)
 
-    def select_seeds(self, G: Graph, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
+    def select_seeds(self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
         if k <= 0:
             return []
         if k > G.n:
             raise ValueError(f"k={k} > n={G.n}")
 
-        clusters = _spectral_clusters_sorted_fiedler(
-            G,
-            rng=rng,
-            min_cluster_size=self.min_cluster_size,
-            max_clusters=k, # unsure about this number
-            normalized=self.normalized_laplacian,
-        )
-        sizes = [len(c) for c in clusters]
-        # alloc[i] tells you how many seeds to pick from clusters[i].
-        alloc = _allocate_budget_proportional(sizes, k) 
-
-        used: Set[int] = set()
-        seeds: List[int] = []
-
-        for cluster, a in sorted(zip(clusters, alloc), key=lambda x: len(x[0]), reverse=True):
-            if a <= 0:
-                continue
-            cset = set(cluster) # for fast access
-
-            # [(u, out_deg), ...]
-            scored: List[Tuple[int, int]] = []
-            for u in cluster:
-                out_deg = 0
-                for v in G.neighbors[u]:
-                    if v not in cset:
-                        out_deg += 1
-                scored.append((u, out_deg))
-
-            scored.sort(key=lambda x: (x[1], G.degrees[x[0]]), reverse=True)
-
-            i = 0
-            picked = 0
-            while picked < a and i < len(scored):
-                j = i
-                while j < len(scored) and scored[j][1] == scored[i][1]:
-                    j += 1
-                block = [u for (u, _) in scored[i:j] if u not in used]
-                if self.per_cluster_tie_shuffle:
-                    rng.shuffle(block)
-                for u in block:
-                    if picked >= a:
-                        break
-                    seeds.append(u)
-                    used.add(u)
-                    picked += 1
-                i = j
-
-        # fallback fill by degree if needed (select nodes with highest degree)
-        if len(seeds) < k:
-            remaining = [u for u in range(G.n) if u not in used]
-            remaining.sort(key=lambda u: G.degrees[u], reverse=True)
-            seeds.extend(remaining[: (k - len(seeds))])
-
-        return seeds[:k]
+        key = (self.min_cluster_size, k, self.normalized_laplacian)
+        clusters = _spectral_clusters(G, *key)  # max_clusters=k: unsure about this number
+        # per-cluster nodes sorted by (#edges leaving the cluster, degree), grouped by the former
+        blocks = _memoized(G, ("boundary_blocks",) + key,
+                           lambda: [_boundary_blocks(G, c) for c in clusters])
+        return _pick_by_cluster(G, clusters, blocks, k, rng, self.per_cluster_tie_shuffle)
 
 
 # Method 2: degree proportional
@@ -335,57 +525,19 @@ class ClusterTopDegreeProportionalSpectral(Strategy):
         self.tie_shuffle = tie_shuffle
 
     def select_seeds_50(
-        self, G: Graph, k: int, rng: random.Random, ctx: StrategyContext, rounds: int = 50
+        self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext, rounds: int = 50
     ) -> List[List[int]]:
         return _select_seeds_50_unique(self, G, k, rng, ctx, rounds=rounds, max_attempts=10)
 
-    def select_seeds(self, G: Graph, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
+    def select_seeds(self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
         if k <= 0:
             return []
         if k > G.n:
             raise ValueError(f"k={k} > n={G.n}")
 
-        clusters = _spectral_clusters_sorted_fiedler(
-            G,
-            rng=rng,
-            min_cluster_size=self.min_cluster_size,
-            max_clusters=k,
-            normalized=self.normalized_laplacian,
-        )
-        sizes = [len(c) for c in clusters]
-        alloc = _allocate_budget_proportional(sizes, k)
-
-        used: Set[int] = set()
-        seeds: List[int] = []
-
-        for cluster, a in sorted(zip(clusters, alloc), key=lambda x: len(x[0]), reverse=True):
-            if a <= 0:
-                continue
-
-            # sort by degree desc
-            nodes_sorted = sorted(cluster, key=lambda u: G.degrees[u], reverse=True)
-
-            i = 0
-            while a > 0 and i < len(nodes_sorted) and len(seeds) < k:
-                deg_i = G.degrees[nodes_sorted[i]]
-                j = i
-                while j < len(nodes_sorted) and G.degrees[nodes_sorted[j]] == deg_i:
-                    j += 1
-                block = [u for u in nodes_sorted[i:j] if u not in used]
-                if self.tie_shuffle:
-                    rng.shuffle(block)
-                for u in block:
-                    if a <= 0 or len(seeds) >= k:
-                        break
-                    seeds.append(u)
-                    used.add(u)
-                    a -= 1
-                i = j
-
-        # fallback fill if needed
-        if len(seeds) < k:
-            remaining = [u for u in range(G.n) if u not in used]
-            remaining.sort(key=lambda u: G.degrees[u], reverse=True)
-            seeds.extend(remaining[: (k - len(seeds))])
-
-        return seeds[:k]
\ No newline at end of file
+        key = (self.min_cluster_size, k, self.normalized_laplacian)
+        clusters = _spectral_clusters(G, *key)
+        # per-cluster nodes sorted by degree desc, grouped by degree
+        blocks = _memoized(G, ("degree_blocks",) + key,
+                           lambda: _degree_blocks(G, clusters))
+        return _pick_by_cluster(G, clusters, blocks, k, rng, self.tie_shuffle)
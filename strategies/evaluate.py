@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.graph import GraphLike, load_graph
+from sim.engine import simulate_batch
+from strategies.base import Strategy, StrategyContext
+from strategies.baselines import get_strategy
+
+
+def parse_spec(spec: str) -> Tuple[str, Dict[str, Any]]:
+    """'top_degree_random_tie:top_m=2.0' -> ('top_degree_random_tie', {'top_m': 2.0})."""
+    name, _, rest = spec.partition(":")
+    kwargs: Dict[str, Any] = {}
+    for item in filter(None, rest.split(",")):
+        key, _, raw = item.partition("=")
+        value: Any = raw
+        if raw.lower() in ("true", "false"):
+            value = raw.lower() == "true"
+        else:
+            for cast in (int, float):
+                try:
+                    value = cast(raw)
+                    break
+                except ValueError:
+                    pass
+        kwargs[key.strip()] = value
+    return name.strip(), kwargs
+
+
+def strategy_from_spec(spec: str) -> Strategy:
+    name, kwargs = parse_spec(spec)
+    return get_strategy(name, **kwargs)
+
+
+def play_trial(
+    G: GraphLike,
+    candidate: str,
+    opponent: str,
+    k: int,
+    rounds: int,
+    seed: int,
+    trial: int,
+) -> Tuple[float, float]:
+    """One full match (all rounds) of candidate vs opponent; returns (outcome, node share).
+
+    outcome is 1 / 0.5 / 0 for win / draw / loss (round wins, then totals,
+    as in simulate_submissions). node share is the candidate's nodes over
+    rounds * n. The opponent's seeds and the caps depend only on (seed,
+    trial, opponent), so every candidate faces the same draws.
+    """
+    ctx = StrategyContext()
+    ours = strategy_from_spec(candidate).select_seeds_50(
+        G, k, random.Random(f"{seed}:{trial}:cand:{candidate}"), ctx, rounds=rounds)
+    theirs = strategy_from_spec(opponent).select_seeds_50(
+        G, k, random.Random(f"{seed}:{trial}:opp:{opponent}"), ctx, rounds=rounds)
+
+    scores = simulate_batch(
+        G, [[ours[r], theirs[r]] for r in range(rounds)],
+        rng=random.Random(f"{seed}:{trial}:caps"), scores_only=True,
+    )
+    ours_sc, theirs_sc = scores[:, 0], scores[:, 1]
+    a = (int(np.sum(ours_sc > theirs_sc)), int(ours_sc.sum()))
+    b = (int(np.sum(theirs_sc > ours_sc)), int(theirs_sc.sum()))
+    outcome = 1.0 if a > b else (0.5 if a == b else 0.0)
+    return outcome, float(ours_sc.sum()) / (rounds * G.n)
+
+
+@dataclass
+class EvalStats:
+    spec: str
+    outcomes: List[float] = field(default_factory=list)
+    shares: List[float] = field(default_factory=list)
+    opponents: List[str] = field(default_factory=list)
+
+    @property
+    def trials(self) -> int:
+        return len(self.outcomes)
+
+    @staticmethod
+    def _mean_var(xs: List[float]) -> Tuple[float, float]:
+        n = len(xs)
+        if n == 0:
+            return 0.0, 0.0
+        mean = sum(xs) / n
+        var = sum((x - mean) ** 2 for x in xs) / (n - 1) if n > 1 else 0.0
+        return mean, var
+
+    def win_rate(self, z: float = 1.96) -> Tuple[float, float, Tuple[float, float]]:
+        """(mean, sample variance, normal-approximation CI) of the match outcome."""
+        return self._summary(self.outcomes, z)
+
+    def node_share(self, z: float = 1.96) -> Tuple[float, float, Tuple[float, float]]:
+        return self._summary(self.shares, z)
+
+    def _summary(self, xs: List[float], z: float) -> Tuple[float, float, Tuple[float, float]]:
+        mean, var = self._mean_var(xs)
+        half = z * math.sqrt(var / len(xs)) if xs else math.inf
+        return mean, var, (mean - half, mean + half)
+
+    def win_rate_by_opponent(self) -> Dict[str, float]:
+        out: Dict[str, List[float]] = {}
+        for opp, x in zip(self.opponents, self.outcomes):
+            out.setdefault(opp, []).append(x)
+        return {opp: sum(xs) / len(xs) for opp, xs in out.items()}
+
+
+# per-worker graph, opened once from the memory-mapped cache
+_WORKER_GRAPH: Optional[GraphLike] = None
+
+
+def _init_worker(graph_path: str) -> None:
+    global _WORKER_GRAPH
+    _WORKER_GRAPH = load_graph(graph_path)
+
+
+def _play_trial_worker(*args) -> Tuple[float, float]:
+    return play_trial(_WORKER_GRAPH, *args)
+
+
+def _separated(stats: Dict[str, EvalStats], z: float, metric: str) -> List[str]:
+    """Candidates still overlapping the leader's interval (the leader included)."""
+    cis = {spec: (s.win_rate(z) if metric == "win" else s.node_share(z)) for spec, s in stats.items()}
+    leader = max(cis, key=lambda spec: cis[spec][0])
+    lo = cis[leader][2][0]
+    return [spec for spec, (_, _, (_, hi)) in cis.items() if spec == leader or hi >= lo]
+
+
+def evaluate_strategies(
+    graph_path: str,
+    candidates: List[str],
+    opponents: List[str],
+    k: int,
+    *,
+    rounds: int = 50,
+    seed: int = 0,
+    min_trials: int = 16,
+    max_trials: int = 200,
+    batch: int = 8,
+    z: float = 1.96,
+    metric: str = "win",
+    workers: int = 1,
+    G: Optional[GraphLike] = None,
+    log=print,
+) -> Dict[str, EvalStats]:
+    """Monte Carlo comparison of candidate strategies against an opponent pool.
+
+    Trial i plays every candidate against opponents[i % len(opponents)] with
+    the same trial seeds. Trials run in batches; after min_trials, candidates
+    whose CI for `metric` ("win" rate or node "share") lies entirely below
+    the leader's are dropped, and sampling stops once only the leader is left
+    (or at max_trials).
+    """
+    if not candidates or not opponents:
+        raise ValueError("Need at least one candidate and one opponent.")
+    if metric not in ("win", "share"):
+        raise ValueError(f"Unknown metric: {metric} (expected 'win' or 'share')")
+    stats = {spec: EvalStats(spec) for spec in candidates}
+    active = list(candidates)
+    if G is None and workers <= 1:
+        G = load_graph(graph_path)
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(graph_path,)) \
+        if workers > 1 else None
+    try:
+        trial = 0
+        while trial < max_trials:
+            trials = range(trial, min(max_trials, trial + batch))
+            tasks = [(spec, opponents[i % len(opponents)], k, rounds, seed, i) for i in trials for spec in active]
+            if pool is None:
+                results = [play_trial(G, *t) for t in tasks]
+            else:
+                results = list(pool.map(_play_trial_worker, *zip(*tasks)))
+            for (spec, opp, *_), (outcome, share) in zip(tasks, results):
+                stats[spec].outcomes.append(outcome)
+                stats[spec].shares.append(share)
+                stats[spec].opponents.append(opp)
+            trial = trials.stop
+
+            if trial >= min_trials and len(active) > 1:
+                still = _separated({spec: stats[spec] for spec in active}, z, metric)
+                dropped = [spec for spec in active if spec not in still]
+                if dropped:
+                    log(f"[Info] after {trial} trials, separated: {', '.join(dropped)}")
+                active = still
+            if len(active) <= 1 and trial >= min_trials:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return stats
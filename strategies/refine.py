@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import random
+from typing import FrozenSet, List, Optional, Set
+
+import numpy as np
+
+from core.graph import GraphLike
+from sim.engine import simulate_batch
+from strategies.base import Strategy, StrategyContext
+
+
+class LocalSwapRefiner(Strategy):
+    """Hill-climbs another strategy's seeds with single-seed swaps.
+
+    Per round:
+      - Take that round's seeds from the `base` strategy's select_seeds_50
+        (so per-round logic such as the cluster strategies' uniqueness
+        check is kept) and sample `samples` opponent
+        seed sets (and a cap each) from the `opponent` strategy
+      - Propose `batch` swaps at a time, each replacing one seed with a
+        neighbour of it or (with probability `jump`) with a node from the top
+        pool_m * k by degree
+      - Score the whole batch against every sample in one simulate_batch
+        call and keep the best swap if it raises the mean node share over
+        the samples, up to `max_evals` proposals; swaps onto a seed set an
+        earlier round already ended with are skipped, so distinct base
+        rounds stay distinct
+    """
+    name = "local_swap"
+
+    def __init__(
+        self,
+        base: str = "top_degree_random_tie:top_m=2.0",
+        opponent: str = "top_degree_random_tie:top_m=2.0",
+        samples: int = 4,
+        max_evals: int = 200,
+        pool_m: float = 5.0,
+        jump: float = 0.3,
+        batch: int = 8,
+    ):
+        self.base = base
+        self.opponent = opponent
+        self.samples = samples
+        self.max_evals = max_evals
+        self.pool_m = pool_m
+        self.jump = jump
+        self.batch = batch
+        self._base: Optional[Strategy] = None
+        self._opponent: Optional[Strategy] = None
+
+    def _strategies(self):
+        if self._base is None:
+            # strategies.evaluate imports the registry, which imports this module
+            from strategies.evaluate import strategy_from_spec
+            self._base = strategy_from_spec(self.base)
+            self._opponent = strategy_from_spec(self.opponent)
+        return self._base, self._opponent
+
+    def select_seeds(self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext) -> List[int]:
+        # one round of select_seeds_50, so the base's per-round logic applies
+        return self.select_seeds_50(G, k, rng, ctx, rounds=1)[0]
+
+    def select_seeds_50(
+        self, G: GraphLike, k: int, rng: random.Random, ctx: StrategyContext, rounds: int = 50
+    ) -> List[List[int]]:
+        if k <= 0:
+            return [[] for _ in range(rounds)]
+        if k > G.n:
+            raise ValueError(f"k={k} > n={G.n}")
+
+        base, _ = self._strategies()
+        seen: Set[FrozenSet[int]] = set()
+        out: List[List[int]] = []
+        for seeds in base.select_seeds_50(G, k, rng, ctx, rounds):
+            out.append(self._refine(G, list(seeds), rng, ctx, seen))
+            seen.add(frozenset(out[-1]))
+        return out
+
+    def _refine(
+        self, G: GraphLike, seeds: List[int], rng: random.Random, ctx: StrategyContext, seen: Set[FrozenSet[int]]
+    ) -> List[int]:
+        """Hill-climb one round's base seeds, never onto a set in `seen`."""
+        _, opp = self._strategies()
+        k = len(seeds)
+        opponents = [opp.select_seeds(G, k, rng, ctx) for _ in range(max(1, self.samples))]
+        caps = [rng.randint(100, 200) for _ in opponents]
+        pool = G.top_degree(min(G.n, max(k, int(self.pool_m * k))))
+
+        def totals(seed_sets: List[List[int]]) -> np.ndarray:
+            # our total score over the samples, same caps for every seed set
+            configs = [[ours, o] for ours in seed_sets for o in opponents]
+            scores = simulate_batch(G, configs, caps=caps * len(seed_sets), scores_only=True)
+            return scores[:, 0].reshape(len(seed_sets), len(opponents)).sum(axis=1)
+
+        best = int(totals([seeds])[0])
+        evals = 0
+        while evals < self.max_evals:
+            trials: List[List[int]] = []
+            taken = set(seeds)
+            for _ in range(min(max(1, self.batch), self.max_evals - evals)):
+                evals += 1
+                i = rng.randrange(k)
+                nbrs = G.neighbors[seeds[i]]
+                if len(nbrs) == 0 or rng.random() < self.jump:
+                    v = pool[rng.randrange(len(pool))]
+                else:
+                    v = int(nbrs[rng.randrange(len(nbrs))])
+                if v in taken:
+                    continue
+                trial = seeds[:i] + [v] + seeds[i + 1:]
+                if frozenset(trial) not in seen:
+                    trials.append(trial)
+            if not trials:
+                continue
+            scores = totals(trials)
+            j = int(np.argmax(scores))  # first best
+            if scores[j] > best:
+                seeds, best = trials[j], int(scores[j])
+        return seeds